@@ -11,24 +11,306 @@ Implements the complete 4-step upload workflow:
 5. Create and download archives
 """
 
+import io
 import os
-import glob
+import sys
 import json
 import time
+import random
+import re
 import boto3
 import requests
 import logging
 import shutil
+import threading
+import queue
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Tuple, Optional
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
+from functools import partial
+from typing import Callable, Iterator, List, Dict, Tuple, Optional
+from boto3.s3.transfer import TransferConfig
+from s3transfer.utils import ReadFileChunk
+from botocore.config import Config
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from http_utils import retry_after_seconds
 from tqdm import tqdm
 from dotenv import load_dotenv
 
+try:
+    # Optional faster JSON decoder
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Library logger stays silent unless setup_logging() enables it
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Default number of concurrent file uploads. The work is network-bound (API
+# calls and S3 transfers), so it is sized well above the CPU count.
+# Override with the CESIUM_MAX_WORKERS environment variable.
+DEFAULT_MAX_WORKERS = int(os.getenv('CESIUM_MAX_WORKERS', min(32, (os.cpu_count() or 1) * 8)))
+
+# Maximum number of S3 transfers running at once, independent of the number
+# of upload workers. Workers mostly wait on Cesium ION API calls, so more of
+# them can run than there are transfers without saturating the uplink.
+# Override with the CESIUM_MAX_TRANSFERS environment variable.
+MAX_CONCURRENT_TRANSFERS = int(os.getenv('CESIUM_MAX_TRANSFERS', 8))
+
+# Maximum number of S3 part uploads in flight across all multipart
+# transfers. Without it, every transfer could send max_concurrency parts at
+# once (8 x 16 by default), well past the ~20 parallel requests beyond which
+# S3 starts throttling and total throughput drops. Throttling that still
+# happens is absorbed by botocore's adaptive retry mode (S3_CLIENT_CONFIG).
+# Override with the CESIUM_MAX_S3_REQUESTS environment variable.
+MAX_CONCURRENT_S3_REQUESTS = int(os.getenv('CESIUM_MAX_S3_REQUESTS', 20))
+
+# Connection pool sizing for the shared Cesium ION session. The pool must be
+# at least as large as the number of worker threads, otherwise threads queue
+# up waiting for a free socket, so CesiumAPIHelper sizes it to twice its
+# worker count; HTTP_POOL_MAXSIZE is the floor.
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+
+# Size of the socket writes used by the requests sessions to send request
+# bodies, such as presigned S3 uploads. urllib3 sends file bodies in 16 KiB
+# writes, which costs a lot of Python-level looping per MB on large uploads.
+# Each connection keeps a buffer of this size while sending, a small price
+# next to the file. boto3's own S3 connections keep urllib3's default.
+HTTP_BLOCKSIZE = 1024 * 1024
+
+# Threads looking up assets missing from the asset list individually
+STATUS_LOOKUP_WORKERS = 8
+
+# Threads that create asset metadata (step 1) ahead of the upload workers
+METADATA_WORKERS = 4
+
+# Threads sending archive creation requests in
+# create_archives_for_completed_assets
+ARCHIVE_WORKERS = 8
+
+# Concurrent archive downloads in download_all_completed_archives. Kept
+# lower than the API-bound pools since each download is bandwidth-bound.
+DOWNLOAD_WORKERS = 4
+
+# Threads that wait for processing and handle archives (steps 4-6) after a
+# file is uploaded. They mostly block on the shared status poller.
+PROCESSING_WORKERS = 64
+
+# Default multipart settings for S3 uploads. GML city models are often hundreds of MB,
+# and every part pays a fixed request overhead, so fewer large parts uploaded
+# concurrently keep the link saturated. Files below the threshold go up in a
+# single PUT. Reads from disk use 1 MiB buffers instead of the 256 KiB default.
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=64 * 1024 * 1024,
+    max_concurrency=16,
+    io_chunksize=1024 * 1024,
+    use_threads=True
+)
+
+# botocore client settings shared by all S3 clients. The pool is sized for
+# every concurrent transfer uploading all of its parts through one client;
+# helpers with a different part concurrency resize it.
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=max(64, MAX_CONCURRENT_TRANSFERS * S3_TRANSFER_CONFIG.max_concurrency),
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+# Number of S3 clients kept around. Cesium ION usually hands out credentials
+# per asset, so old clients are dropped instead of piling up with their
+# connection pools.
+S3_CLIENT_CACHE_SIZE = MAX_CONCURRENT_TRANSFERS * 2
+
+# Tiling options sent with every new asset
+ASSET_OPTIONS = {
+    "sourceType": "CITYGML",
+    "textureFormat": "KTX2",
+    "geometryCompression": "DRACO",
+    "clampToTerrain": True,
+    "baseTerrainId": 1  # Cesium World Terrain
+}
+
+# Asset creation request body, encoded once. Only the JSON-encoded name and
+# description are filled into the %b placeholders per file.
+ASSET_PAYLOAD_TEMPLATE = (
+    b'{"name":%b,"type":"3DTILES","description":%b,"options":'
+    + json.dumps(ASSET_OPTIONS, separators=(',', ':')).encode('utf-8')
+    + b'}'
+)
+
+# Archive creation request body; only the asset ID is filled in per asset
+ARCHIVE_PAYLOAD_TEMPLATE = b'{"type":"FULL","format":"ZIP","assetIds":[%d]}'
+
+# HTTP statuses treated as transient by every retry in this module
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Methods the API session re-sends on any of RETRY_STATUS_CODES and on read
+# errors, since repeating them has no further effect
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'])
+
+# Statuses on which a POST or PATCH (asset or archive creation, upload
+# completion) is re-sent, and only with a Retry-After header. A gateway
+# 500/502/504 may arrive after the server committed the request, so
+# retrying those could create duplicate assets or archives.
+RATE_LIMIT_STATUS_CODES = (429, 503)
+
+# Attempts at a presigned S3 upload. The file is reopened for each attempt,
+# which HTTP-level retries cannot do for a streamed body.
+PRESIGNED_UPLOAD_MAX_ATTEMPTS = 3
+
+# Backoff between application-level retries (seconds)
+RETRY_INITIAL_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+# Backoff schedule for asset processing status polling (seconds)
+PROCESSING_POLL_INITIAL_DELAY = 2.0
+PROCESSING_POLL_MAX_DELAY = 30.0
+
+# Backoff schedule for archive status polling (seconds). Archives usually
+# finish within a minute, so the cap is lower than for asset processing.
+ARCHIVE_POLL_INITIAL_DELAY = 1.0
+ARCHIVE_POLL_MAX_DELAY = 15.0
+
+# How long a fetched asset list is reused (seconds)
+ASSETS_CACHE_TTL = 5.0
+
+# How long a fetched archive list is reused (seconds)
+ARCHIVES_CACHE_TTL = 30.0
+
+# Asset statuses that end processing
+PROCESSING_FINAL_STATUSES = ('COMPLETE', 'ERROR', 'DATA_ERROR')
+
+# Append-only record of upload results, one JSON object per line. Files
+# recorded as successful are skipped on later runs unless forced.
+RESULTS_LOG_FILE = "cesium_uploads.jsonl"
+
+# Checkpoints of interrupted multipart uploads, one JSON file per GML file.
+# They hold the temporary upload credentials, so they are only trusted for
+# UPLOAD_STATE_MAX_AGE seconds before the upload starts over.
+UPLOAD_STATE_DIR = ".cesium_upload_state"
+UPLOAD_STATE_MAX_AGE = 3600
+
+# Read size for streaming archive downloads to disk. Archives can be
+# several GB, so they are never held in memory as a whole.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Characters removed from archive names to build file names: anything but
+# letters, digits, spaces, '-', '_' and '.'
+UNSAFE_FILENAME_CHARS = re.compile(r'[^\w .\-]')
+
+# Minimum time between progress bar redraws (seconds)
+PROGRESS_REFRESH_INTERVAL = 0.5
+
+# Minimum time between S3 upload progress log lines per file (seconds)
+UPLOAD_PROGRESS_LOG_INTERVAL = 2.0
+
+# Print only counts, not one entry per archive, in the archive creation and
+# download summaries (set CESIUM_QUIET=1); the entries still go to the log
+QUIET_OUTPUT = os.getenv('CESIUM_QUIET', '').lower() in ('1', 'true', 'yes')
+
+# Include debug messages, such as upload progress, in the log when logging
+# is enabled (set CESIUM_DEBUG=1)
+DEBUG_LOGGING = os.getenv('CESIUM_DEBUG', '').lower() in ('1', 'true', 'yes')
+
+
+@dataclass
+class UploadResult:
+    """Outcome of uploading a single GML file."""
+    __slots__ = ('file', 'ok', 'message', 'asset_id')
+    
+    file: str
+    ok: bool
+    message: str
+    asset_id: Optional[str]
+
+
+class ApiRetry(Retry):
+    """Retry that re-sends non-idempotent requests only when rate limited.
+    
+    Methods in allowed_methods follow the usual rules. Other methods are
+    retried on connection errors, and on RATE_LIMIT_STATUS_CODES answers
+    that carry a Retry-After header, never on other statuses or read errors.
+    """
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if self._is_method_retryable(method):
+            return super().is_retry(method, status_code, has_retry_after)
+        return bool(
+            self.total
+            and self.respect_retry_after_header
+            and has_retry_after
+            and status_code in RATE_LIMIT_STATUS_CODES
+        )
+
+
+class BlocksizeHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections send request bodies in HTTP_BLOCKSIZE writes.
+    
+    The block size is passed to every connection the adapter's pools
+    create, HTTPS included, instead of changing urllib3's defaults.
+    """
+    
+    def init_poolmanager(self, *args, **pool_kwargs) -> None:
+        pool_kwargs.setdefault('blocksize', HTTP_BLOCKSIZE)
+        super().init_poolmanager(*args, **pool_kwargs)
+    
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs.setdefault('blocksize', HTTP_BLOCKSIZE)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+def sleep_with_backoff(delay: float, max_delay: float, wake: Optional[threading.Event] = None) -> float:
+    """Sleep for delay seconds with +/-20% jitter and return the next delay.
+    
+    Args:
+        delay: Current delay in seconds
+        max_delay: Upper bound for the returned delay
+        wake: Optional event that ends the sleep early when set. It is
+            cleared before returning.
+        
+    Returns:
+        The doubled delay, capped at max_delay
+    """
+    duration = delay * random.uniform(0.8, 1.2)
+    if wake is None:
+        time.sleep(duration)
+    else:
+        wake.wait(duration)
+        wake.clear()
+    return min(delay * 2, max_delay)
+
+
+def parse_json(response: requests.Response):
+    """Decode a JSON response body, using orjson when it is installed.
+    
+    Args:
+        response: Response to decode
+        
+    Returns:
+        Decoded JSON value
+        
+    Raises:
+        requests.exceptions.JSONDecodeError: If the body is not valid JSON
+    """
+    if orjson is None:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+
+
+def _noop(*args, **kwargs) -> None:
+    """Stand-in for logger methods when logging is disabled."""
+
 
 def setup_logging(enabled: bool = False) -> logging.Logger:
     """Set up logging configuration for the upload process.
@@ -64,7 +346,9 @@ def setup_logging(enabled: bool = False) -> logging.Logger:
         ]
     )
     
-    logger.setLevel(logging.INFO)
+    # Only this module logs debug messages; the root logger stays at INFO
+    # so boto3 and urllib3 do not flood the log
+    logger.setLevel(logging.DEBUG if DEBUG_LOGGING else logging.INFO)
     logger.info(f"=== Cesium ION Upload Session Started ===")
     logger.info(f"Log file: {log_file}")
     
@@ -72,71 +356,302 @@ def setup_logging(enabled: bool = False) -> logging.Logger:
 
 
 class CesiumAPIHelper:
-    def __init__(self, enable_logging: bool = False):
+    def __init__(self, enable_logging: bool = False, multipart_chunksize: int = S3_TRANSFER_CONFIG.multipart_chunksize, max_concurrency: int = S3_TRANSFER_CONFIG.max_concurrency, quiet: Optional[bool] = None, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Args:
+            enable_logging: Whether to enable logging (default: False)
+            multipart_chunksize: S3 multipart part size in bytes (default: 64 MiB)
+            max_concurrency: Parts of one file uploaded concurrently (default: 16);
+                all files together send at most MAX_CONCURRENT_S3_REQUESTS
+            quiet: Leave per-archive entries out of the archive summaries
+                (default: CESIUM_QUIET environment variable)
+            max_workers: Concurrent uploads used by upload_files_parallel;
+                the HTTP connection pools are sized for it
+                (default: DEFAULT_MAX_WORKERS)
+        """
         self.api_url = "https://api.cesium.com"
         self.api_asset_url = f"{self.api_url}/v1/assets"
         self.api_archive_url = f"{self.api_url}/v1/archives"
         self.token = os.getenv('CESIUM_ION_TOKEN')
         self.enable_logging = enable_logging
+        self.quiet = QUIET_OUTPUT if quiet is None else quiet
         
-        # Set up logging
+        # Set up logging. Call sites use the bound level methods directly;
+        # they are no-ops when logging is disabled, and debug is one too
+        # unless the logger emits it. Hot paths pass %-style arguments so
+        # no message is formatted for a no-op.
         self.logger = setup_logging(enable_logging)
+        self._log_debug = self.logger.debug if enable_logging and self.logger.isEnabledFor(logging.DEBUG) else _noop
+        self._log_info = self.logger.info if enable_logging else _noop
+        self._log_warning = self.logger.warning if enable_logging else _noop
+        self._log_error = self.logger.error if enable_logging else _noop
+        
+        # File this session logs to, taken from the configured handler
+        self.log_file_path: Optional[Path] = None
+        if enable_logging:
+            for handler in logging.getLogger().handlers:
+                if isinstance(handler, logging.FileHandler):
+                    self.log_file_path = Path(handler.baseFilename)
+                    break
         
         if not self.token:
             if enable_logging:
-                self._log("error", "CESIUM_ION_TOKEN environment variable not found")
+                self._log_error("CESIUM_ION_TOKEN environment variable not found")
             raise ValueError("CESIUM_ION_TOKEN environment variable is required")
         
         if enable_logging:
-            self._log("info", "Cesium ION API Helper initialized")
-            self._log("info", f"API URL: {self.api_url}")
+            self._log_info("Cesium ION API Helper initialized")
+            self._log_info(f"API URL: {self.api_url}")
         
         self.headers = {
             'Authorization': f'Bearer {self.token}',
             'Content-Type': 'application/json'
         }
         
+        # Shared session so every API call reuses pooled keep-alive connections
+        # instead of paying a new TCP + TLS handshake per request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
+        # Unauthenticated session for presigned URLs, which must not receive
+        # the Cesium ION Authorization header
+        self.transfer_session = requests.Session()
+        
+        self.max_workers = max_workers
+        self._mount_session_adapters(max_workers)
+        
+        # S3 clients cached per temporary credentials so concurrent uploads
+        # share one client and its connection pool. All clients come from one
+        # boto3 session so service models are loaded only once.
+        self._boto_session = boto3.session.Session()
+        self._s3_clients = OrderedDict()
+        self._s3_clients_lock = threading.Lock()
+        
+        if multipart_chunksize < 5 * 1024 * 1024:
+            raise ValueError("multipart_chunksize must be at least 5 MiB, the S3 minimum part size")
+        
+        # Multipart settings, tunable per network. The client connection
+        # pool must be large enough for every concurrent part.
+        self.transfer_config = TransferConfig(
+            multipart_threshold=S3_TRANSFER_CONFIG.multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+            io_chunksize=S3_TRANSFER_CONFIG.io_chunksize,
+            use_threads=True
+        )
+        self._s3_client_config = S3_CLIENT_CONFIG.merge(Config(
+            max_pool_connections=max(64, MAX_CONCURRENT_TRANSFERS * max_concurrency)
+        ))
+        
+        # Part uploads of all multipart transfers share one pool, so its
+        # threads are reused from file to file and the total number of
+        # concurrent part requests stays under the S3 throttling limit.
+        # Each file keeps at most max_concurrency of its parts in flight.
+        self._part_executor = ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_TRANSFERS * max_concurrency, MAX_CONCURRENT_S3_REQUESTS),
+            thread_name_prefix='cesium-part'
+        )
+        
+        # Serializes picking archive file names between parallel downloads,
+        # with the names known to exist per output directory
+        self._download_names_lock = threading.Lock()
+        self._output_dir_names: Dict[str, set] = {}
+        
+        # Limits concurrent S3 transfers across all upload workers
+        self._transfer_slots = threading.BoundedSemaphore(MAX_CONCURRENT_TRANSFERS)
+        
+        # Recently fetched asset list as (fetch time, assets)
+        self._assets_cache: Tuple[float, Optional[List[Dict]]] = (0.0, None)
+        self._assets_cache_lock = threading.Lock()
+        
+        # Recently fetched archive list as (fetch time, archives); cleared
+        # whenever an archive is created
+        self._archives_cache: Tuple[float, Optional[List[Dict]]] = (0.0, None)
+        self._archives_cache_lock = threading.Lock()
+        
+        # Last ETag and decoded body per polled URL as {url: (etag, body)}
+        self._etag_cache: Dict[str, Tuple[str, object]] = {}
+        
+        # Retry-After hint of the last response per polled URL, in seconds
+        self._retry_after: Dict[str, float] = {}
+        
+        # Assets awaiting processing, resolved by a single background poller
+        self._status_futures: Dict[str, Future] = {}
+        self._status_lock = threading.Lock()
+        self._poller_thread: Optional[threading.Thread] = None
+        # Set when an asset is registered so the poller checks it right away
+        # instead of finishing a backed-off sleep of up to 30 s first
+        self._poll_wakeup = threading.Event()
+        
+        # 'uploads' holds one UploadResult per file, successful or not
         self.results = {
-            'success': [],
-            'failed': [],
-            'archived': []
+            'uploads': [],
+            'archived': [],
+            'skipped': []
         }
+        self.results_log_path = Path(RESULTS_LOG_FILE)
     
-    def _log(self, level: str, message: str) -> None:
-        """Helper method for conditional logging."""
-        if self.enable_logging:
-            getattr(self.logger, level)(message)
-    
+    def _mount_session_adapters(self, max_workers: int) -> None:
+        """
+        Mount pooled, retrying HTTPS adapters on both sessions.
+        
+        Args:
+            max_workers: Worker threads that share the sessions; each pool
+                holds twice as many connections, at least HTTP_POOL_MAXSIZE
+        """
+        pool_maxsize = max(HTTP_POOL_MAXSIZE, max_workers * 2)
+        self._pool_workers = max_workers
+        # Release the connections of the adapters being replaced
+        self.session.get_adapter('https://').close()
+        self.transfer_session.get_adapter('https://').close()
+        
+        self.session.mount('https://', BlocksizeHTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize,
+            max_retries=ApiRetry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=RETRY_STATUS_CODES,
+                # POST/PATCH calls (asset and archive creation, upload
+                # completion) are only retried when rate limited; see ApiRetry
+                allowed_methods=IDEMPOTENT_METHODS,
+                respect_retry_after_header=True
+            )
+        ))
+        
+        # Only GETs are retried on the transfer session: presigned uploads
+        # stream a file body that cannot be replayed, so
+        # _upload_file_presigned retries them itself.
+        self.transfer_session.mount('https://', BlocksizeHTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset(['GET', 'HEAD']),
+                respect_retry_after_header=True
+            )
+        ))
+
     def get_gml_files(self, data_folder: str = 'data') -> List[str]:
-        """Get all GML files from the data folder."""
-        pattern = os.path.join(data_folder, '*.gml')
-        gml_files = glob.glob(pattern)
-        self._log("info", f"Scanning for GML files in '{data_folder}' folder")
-        self._log("info", f"Found {len(gml_files)} GML files: {[Path(f).name for f in gml_files]}")
+        """Get all GML files (any case of the .gml extension) from the data folder."""
+        self._log_info(f"Scanning for GML files in '{data_folder}' folder")
+
+        # os.scandir reuses the directory entry metadata, so no extra stat
+        # calls or fnmatch pass are needed to filter the listing
+        try:
+            with os.scandir(data_folder) as entries:
+                gml_files = [
+                    entry.path for entry in entries
+                    if entry.name.lower().endswith('.gml') and entry.is_file()
+                ]
+        except FileNotFoundError:
+            gml_files = []
+
+        self._log_info(f"Found {len(gml_files)} GML files")
+        # The full listing can be tens of thousands of names; only build it
+        # when debug output is actually emitted
+        if self._log_debug is not _noop:
+            self._log_debug(f"GML files: {[os.path.basename(f) for f in gml_files]}")
         return gml_files
 
-    def get_cesium_ion_assets_list(self) -> List[Dict]:
+    def _get_json_cached(self, url: str):
+        """
+        GET a JSON resource, revalidating a previous response with its ETag.
+        
+        A 304 Not Modified answer reuses the body decoded last time. Servers
+        that send no ETag are simply fetched in full. A Retry-After header is
+        kept in self._retry_after for pollers of the URL.
+        
+        Args:
+            url: URL of the resource
+            
+        Returns:
+            Decoded JSON value (shared between callers, do not modify)
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        cached = self._etag_cache.get(url)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        
+        response = self.session.get(url, headers=headers, timeout=30)
+        retry_after = retry_after_seconds(response)
+        if retry_after is None:
+            self._retry_after.pop(url, None)
+        else:
+            self._retry_after[url] = retry_after
+        if cached and response.status_code == 304:
+            return cached[1]
+        response.raise_for_status()
+        
+        body = parse_json(response)
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etag_cache[url] = (etag, body)
+        return body
+
+    def get_cesium_ion_assets_list(self, use_cache: bool = True) -> List[Dict]:
         """
         Fetch the list of assets from Cesium ION.
         
+        Results are cached for ASSETS_CACHE_TTL seconds. Concurrent callers
+        wait for a single in-flight request instead of each sending their own.
+        
+        Args:
+            use_cache: Whether a recently fetched list may be returned (default: True)
+        
         Returns:
-            List of asset dictionaries
+            List of asset dictionaries (shared between callers, do not modify)
         """
-        try:
-            self._log("info", "Fetching asset list from Cesium ION")
-            response = requests.get(
-                self.api_asset_url,
-                headers=self.headers,
-                timeout=30
-            )
-            response.raise_for_status()
-            assets = response.json().get('assets', [])
-            self._log("info", f"Successfully fetched {len(assets)} assets from Cesium ION")
-            return assets
-        except requests.exceptions.RequestException as e:
-            self._log("error", f"Error fetching assets: {str(e)}")
-            print(f"Error fetching assets: {str(e)}")
-            return []
+        with self._assets_cache_lock:
+            fetched_at, cached_assets = self._assets_cache
+            if use_cache and cached_assets is not None and time.monotonic() - fetched_at < ASSETS_CACHE_TTL:
+                self._log_debug("Using cached asset list")
+                return cached_assets
+            
+            try:
+                self._log_info("Fetching asset list from Cesium ION")
+                assets = self._get_json_cached(self.api_asset_url).get('assets', [])
+                self._log_info("Successfully fetched %d assets from Cesium ION", len(assets))
+                self._assets_cache = (time.monotonic(), assets)
+                return assets
+            except requests.exceptions.RequestException as e:
+                self._log_error(f"Error fetching assets: {str(e)}")
+                return []
+
+    def get_assets_by_ids(self, asset_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Look up several assets with one asset list request.
+        
+        Assets missing from the listing are fetched individually, in
+        parallel.
+        
+        Args:
+            asset_ids: IDs of the assets to look up
+            
+        Returns:
+            Dictionary mapping asset ID (as a string) to asset information
+            (shared between callers, do not modify); assets that could not
+            be retrieved are left out
+        """
+        wanted = {str(asset_id) for asset_id in asset_ids}
+        assets_by_id = {}
+        for asset in self.get_cesium_ion_assets_list():
+            asset_id = str(asset.get('id'))
+            if asset_id in wanted:
+                assets_by_id[asset_id] = asset
+        
+        # Fetch the rest concurrently so one slow asset does not hold up
+        # the others
+        missing = list(wanted - assets_by_id.keys())
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(STATUS_LOOKUP_WORKERS, len(missing)), thread_name_prefix='cesium-status') as lookup_executor:
+                for asset_id, asset in zip(missing, lookup_executor.map(self.get_asset_status, missing)):
+                    if asset:
+                        assets_by_id[asset_id] = asset
+        return assets_by_id
 
     def get_asset_status(self, asset_id: str) -> Optional[Dict]:
         """
@@ -150,128 +665,443 @@ class CesiumAPIHelper:
         """
         try:
             url = f"{self.api_asset_url}/{asset_id}"
-            self._log("debug", f"Checking status for asset {asset_id}")
-            response = requests.get(
-                url,
-                headers=self.headers,
-                timeout=30
-            )
-            response.raise_for_status()
-            asset_data = response.json()
-            status = asset_data.get('status', 'UNKNOWN')
-            self._log("debug", f"Asset {asset_id} status: {status}")
+            self._log_debug("Checking status for asset %s", asset_id)
+            asset_data = self._get_json_cached(url)
+            self._log_debug("Asset %s status: %s", asset_id, asset_data.get('status', 'UNKNOWN'))
             return asset_data
         except requests.exceptions.RequestException as e:
-            self._log("error", f"Error fetching asset {asset_id}: {str(e)}")
-            print(f"Error fetching asset {asset_id}: {str(e)}")
+            self._log_error(f"Error fetching asset {asset_id}: {str(e)}")
             return None
     
-    def create_asset_metadata(self, file_path: str) -> Optional[Dict]:
+    def _upload_state_path(self, filename: str) -> Path:
+        """Get the checkpoint file path of an upload."""
+        return Path(UPLOAD_STATE_DIR) / f"{filename}.json"
+    
+    def _load_upload_state(self, filename: str) -> Optional[Dict]:
+        """
+        Load the checkpoint of an interrupted upload.
+        
+        Args:
+            filename: Name of the GML file
+            
+        Returns:
+            Checkpoint dictionary, or None if there is no usable checkpoint
+        """
+        state_path = self._upload_state_path(filename)
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self._log_warning(f"Ignoring unreadable upload checkpoint {state_path}: {str(e)}")
+            return None
+        
+        if time.time() - state.get('created_at', 0) > UPLOAD_STATE_MAX_AGE:
+            self._log_info(f"Discarding expired upload checkpoint for {filename}")
+            self._clear_upload_state(filename)
+            return None
+        return state
+    
+    def _save_upload_state(self, filename: str, state: Dict) -> None:
+        """
+        Atomically write the checkpoint of an upload.
+        
+        Args:
+            filename: Name of the GML file
+            state: Checkpoint dictionary
+        """
+        state_path = self._upload_state_path(filename)
+        state_path.parent.mkdir(exist_ok=True)
+        tmp_path = state_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, state_path)
+    
+    def _clear_upload_state(self, filename: str) -> None:
+        """Remove the checkpoint of an upload, if any."""
+        try:
+            self._upload_state_path(filename).unlink()
+        except FileNotFoundError:
+            pass
+    
+    def _prepare_upload(self, file_path: str, filename: Optional[str] = None, stem: Optional[str] = None) -> Optional[Dict]:
+        """
+        Step 1, reusing the asset of an interrupted upload when one was checkpointed.
+        
+        Args:
+            file_path: Path to the GML file
+            filename: File name of file_path, computed if not given
+            stem: File name without extension, computed if not given
+            
+        Returns:
+            Response containing upload location and asset metadata
+        """
+        if filename is None:
+            filename = os.path.basename(file_path)
+        
+        state = self._load_upload_state(filename)
+        if state:
+            asset_id = state['metadata']['assetMetadata']['id']
+            self._log_info(f"Resuming interrupted upload of {filename} (Asset ID: {asset_id})")
+            return state['metadata']
+        return self.create_asset_metadata(file_path, filename, stem)
+    
+    def create_asset_metadata(self, file_path: str, filename: Optional[str] = None, stem: Optional[str] = None) -> Optional[Dict]:
         """
         Step 1: Create asset metadata and get upload credentials.
         
         Args:
             file_path: Path to the GML file
+            filename: File name of file_path, computed if not given
+            stem: File name without extension, computed if not given
             
         Returns:
             Response containing upload location and asset metadata
         """
-        filename = Path(file_path).name
-        name_without_ext = Path(file_path).stem
-        
-        self._log("info", f"Step 1: Creating asset metadata for {filename}")
-        
-        payload = {
-            "name": name_without_ext,
-            "type": "3DTILES",
-            "description": f"Uploaded GML file: {filename} from Cesium Helper script",
-            "options": {
-                "sourceType": "CITYGML",
-                "textureFormat": "KTX2",
-                "geometryCompression": "DRACO",
-                "clampToTerrain": True,
-                "baseTerrainId": 1  # Cesium World Terrain
-            }
-        }
+        if filename is None or stem is None:
+            filename = os.path.basename(file_path)
+            stem = os.path.splitext(filename)[0]
         
-        self._log("debug", f"Asset metadata payload: {json.dumps(payload, indent=2)}")
+        self._log_info(f"Step 1: Creating asset metadata for {filename}")
+        
+        description = f"Uploaded GML file: {filename} from Cesium Helper script"
+        body = ASSET_PAYLOAD_TEMPLATE % (
+            json.dumps(stem).encode('utf-8'),
+            json.dumps(description).encode('utf-8')
+        )
+        
+        self._log_debug("Asset metadata payload: %s", body)
         
         try:
-            response = requests.post(
+            # The session already sends Content-Type: application/json
+            response = self.session.post(
                 self.api_asset_url,
-                headers=self.headers,
-                json=payload,
+                data=body,
                 timeout=30
             )
             response.raise_for_status()
-            result = response.json()
+            result = parse_json(response)
             asset_id = result['assetMetadata']['id']
-            self._log("info", f"✅ Asset metadata created successfully for {filename} (Asset ID: {asset_id})")
+            self._log_info(f"✅ Asset metadata created successfully for {filename} (Asset ID: {asset_id})")
             return result
             
         except requests.exceptions.RequestException as e:
-            self._log("error", f"❌ Error creating asset metadata for {filename}: {str(e)}")
-            print(f"Error creating asset metadata: {str(e)}")
+            self._log_error(f"❌ Error creating asset metadata for {filename}: {str(e)}")
             return None
 
-    def upload_file_to_s3(self, file_path: str, upload_location: Dict) -> bool:
+    def _get_s3_client(self, upload_location: Dict):
+        """
+        Get a cached S3 client for the temporary credentials in upload_location.
+        
+        Args:
+            upload_location: Upload location info from step 1
+            
+        Returns:
+            boto3 S3 client
+        """
+        credentials = (
+            upload_location['accessKey'],
+            upload_location['secretAccessKey'],
+            upload_location['sessionToken']
+        )
+        
+        # Client creation on a shared session is not thread-safe, so it
+        # happens under the lock
+        with self._s3_clients_lock:
+            s3_client = self._s3_clients.get(credentials)
+            if s3_client is not None:
+                self._s3_clients.move_to_end(credentials)
+            else:
+                self._log_debug("Creating S3 client for new temporary credentials")
+                s3_client = self._boto_session.client(
+                    's3',
+                    region_name='us-east-1',
+                    aws_access_key_id=credentials[0],
+                    aws_secret_access_key=credentials[1],
+                    aws_session_token=credentials[2],
+                    config=self._s3_client_config
+                )
+                self._s3_clients[credentials] = s3_client
+                # Evict the least recently used client; transfers still
+                # holding it keep working
+                if len(self._s3_clients) > S3_CLIENT_CACHE_SIZE:
+                    self._s3_clients.popitem(last=False)
+        
+        return s3_client
+
+    def _upload_file_presigned(self, file_path: str, filename: str, upload_location: Dict) -> None:
+        """
+        Upload a file to a presigned S3 URL.
+        
+        A presigned POST (url + fields) is sent as a multipart form, a plain
+        presigned URL is sent as a PUT that streams the file from disk.
+        
+        Args:
+            file_path: Path to the file to upload
+            filename: Name of the file
+            upload_location: Upload location info from step 1 containing the presigned URL
+            
+        Transient failures are retried with backoff.
+        
+        Raises:
+            requests.exceptions.RequestException: If the upload fails
+        """
+        url = upload_location['url']
+        self._log_debug(f"Presigned upload details - URL: {url.split('?')[0]}")
+        
+        delay = RETRY_INITIAL_DELAY
+        for attempt in range(1, PRESIGNED_UPLOAD_MAX_ATTEMPTS + 1):
+            try:
+                with open(file_path, 'rb') as f:
+                    # The file is streamed front to back once; let the kernel
+                    # read ahead aggressively (not available on Windows/macOS)
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    
+                    if 'fields' in upload_location:
+                        response = self.transfer_session.post(
+                            url,
+                            data=upload_location['fields'],
+                            files={'file': (filename, f)},
+                            timeout=300
+                        )
+                    else:
+                        # requests cannot size an empty file object and
+                        # would fall back to chunked encoding, which
+                        # presigned PUTs reject; send an empty body instead
+                        response = self.transfer_session.put(
+                            url,
+                            data=f if os.fstat(f.fileno()).st_size else b'',
+                            timeout=300
+                        )
+                response.raise_for_status()
+                return
+            except requests.exceptions.RequestException as e:
+                # Connection errors and throttling are worth another attempt,
+                # other HTTP errors are not
+                status = e.response.status_code if e.response is not None else None
+                if (status is not None and status not in RETRY_STATUS_CODES) or attempt == PRESIGNED_UPLOAD_MAX_ATTEMPTS:
+                    raise
+                self._log_warning(f"Retrying upload of {filename} after error: {str(e)} (attempt {attempt + 1}/{PRESIGNED_UPLOAD_MAX_ATTEMPTS})")
+                delay = sleep_with_backoff(delay, RETRY_MAX_DELAY)
+
+    def _upload_file_multipart(self, s3_client, file_path: str, filename: str, bucket: str, s3_key: str, metadata: Dict, upload_callback: Optional[Callable[[int], None]] = None, file_stat: Optional[os.stat_result] = None) -> None:
+        """
+        Upload a file to S3 in parts, checkpointing every completed part.
+        
+        If the process stops, the next run resumes the same multipart upload
+        and only sends the parts that are missing.
+        
+        Args:
+            s3_client: S3 client for the temporary credentials
+            file_path: Path to the file to upload
+            filename: Name of the file
+            bucket: Target bucket
+            s3_key: Target key
+            metadata: Step 1 response, saved so a rerun can reuse the asset
+            upload_callback: Optional progress callback taking a byte count
+            file_stat: os.stat() result of file_path, taken if not given
+            
+        Raises:
+            botocore.exceptions.BotoCoreError, botocore.exceptions.ClientError: If the upload fails
+        """
+        if file_stat is None:
+            file_stat = os.stat(file_path)
+        part_size = self.transfer_config.multipart_chunksize
+        part_count = -(-file_stat.st_size // part_size)
+        
+        state = self._load_upload_state(filename)
+        if not (state
+                and state.get('bucket') == bucket and state.get('key') == s3_key
+                and state.get('file_size') == file_stat.st_size and state.get('mtime') == file_stat.st_mtime
+                and state.get('part_size') == part_size):
+            if state and state.get('upload_id'):
+                # The file or target changed; drop the stale upload
+                try:
+                    s3_client.abort_multipart_upload(Bucket=state['bucket'], Key=state['key'], UploadId=state['upload_id'])
+                except Exception as e:
+                    self._log_warning(f"Could not abort stale multipart upload for {filename}: {str(e)}")
+            upload_id = s3_client.create_multipart_upload(Bucket=bucket, Key=s3_key)['UploadId']
+            state = {
+                'metadata': metadata,
+                'created_at': time.time(),
+                'bucket': bucket,
+                'key': s3_key,
+                'file_size': file_stat.st_size,
+                'mtime': file_stat.st_mtime,
+                'part_size': part_size,
+                'upload_id': upload_id,
+                'parts': {},
+                'uploaded': False
+            }
+            self._save_upload_state(filename, state)
+        elif state['uploaded']:
+            self._log_info(f"{filename} was already fully uploaded to S3 before the interruption")
+            return
+        else:
+            self._log_info(f"Resuming multipart upload of {filename} with {len(state['parts'])}/{part_count} parts done")
+        
+        state_lock = threading.Lock()
+        
+        def upload_part(part_number: int) -> None:
+            offset = (part_number - 1) * part_size
+            size = min(part_size, file_stat.st_size - offset)
+            with ReadFileChunk.from_filename(file_path, offset, size) as body:
+                response = s3_client.upload_part(
+                    Bucket=bucket,
+                    Key=s3_key,
+                    UploadId=state['upload_id'],
+                    PartNumber=part_number,
+                    Body=body
+                )
+            with state_lock:
+                state['parts'][str(part_number)] = response['ETag']
+                self._save_upload_state(filename, state)
+                # Parts finish on several threads; report them one at a time
+                if upload_callback:
+                    upload_callback(size)
+        
+        # Submit parts in a sliding window of max_concurrency, so one large
+        # file cannot fill the shared pool's queue ahead of other files
+        part_slots = threading.Semaphore(self.transfer_config.max_concurrency)
+        part_failed = threading.Event()
+        
+        def upload_part_in_slot(part_number: int) -> None:
+            try:
+                upload_part(part_number)
+            except BaseException:
+                part_failed.set()
+                raise
+            finally:
+                part_slots.release()
+        
+        part_futures = []
+        try:
+            for n in range(1, part_count + 1):
+                if str(n) in state['parts']:
+                    continue
+                part_slots.acquire()
+                if part_failed.is_set():
+                    # The failing future is collected below
+                    part_slots.release()
+                    break
+                part_futures.append(self._part_executor.submit(upload_part_in_slot, n))
+            for part_future in part_futures:
+                part_future.result()
+        except BaseException:
+            # Do not keep sending parts of a failed upload; finished parts
+            # stay checkpointed for the next run
+            for part_future in part_futures:
+                part_future.cancel()
+            raise
+        
+        s3_client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=s3_key,
+            UploadId=state['upload_id'],
+            MultipartUpload={'Parts': [
+                {'ETag': state['parts'][str(n)], 'PartNumber': n} for n in range(1, part_count + 1)
+            ]}
+        )
+        
+        # Keep the checkpoint until step 3 succeeds, so a rerun goes
+        # straight to the notification
+        state['uploaded'] = True
+        self._save_upload_state(filename, state)
+
+    def upload_file_to_s3(self, file_path: str, upload_location: Dict, filename: Optional[str] = None, metadata: Optional[Dict] = None) -> bool:
         """
         Step 2: Upload file to Amazon S3 using temporary credentials.
         
         Args:
             file_path: Path to the file to upload
             upload_location: Upload location info from step 1
+            filename: File name of file_path, computed if not given
+            metadata: Full step 1 response; when given, multipart uploads are
+                checkpointed so an interrupted run can resume them
             
         Returns:
             True if upload successful, False otherwise
         """
-        filename = Path(file_path).name
-        file_size = Path(file_path).stat().st_size
+        if filename is None:
+            filename = os.path.basename(file_path)
+        file_stat = os.stat(file_path)
+        file_size = file_stat.st_size
         file_size_mb = file_size / (1024 * 1024)
         
-        self._log("info", f"Step 2: Uploading {filename} to S3 (Size: {file_size_mb:.2f} MB)")
+        self._log_info(f"Step 2: Uploading {filename} to S3 (Size: {file_size_mb:.2f} MB)")
         
         try:
-            # Initialize S3 client with temporary credentials
-            s3_client = boto3.client(
-                's3',
-                region_name='us-east-1',
-                aws_access_key_id=upload_location['accessKey'],
-                aws_secret_access_key=upload_location['secretAccessKey'],
-                aws_session_token=upload_location['sessionToken']
-            )
-            
-            s3_key = f"{upload_location['prefix']}{filename}"
-            bucket = upload_location['bucket']
-            
-            self._log("debug", f"S3 upload details - Bucket: {bucket}, Key: {s3_key}")
-            
-            # Track upload progress
-            uploaded_bytes = [0]
+            # Resolve the client and sign single-part PUTs before taking a
+            # transfer slot, so slots are only held while data is moving
+            s3_client = None
+            if 'url' in upload_location:
+                # Presigned upload location: no S3 client or request signing needed
+                presigned_location = upload_location
+            else:
+                # Get S3 client for the temporary credentials
+                s3_client = self._get_s3_client(upload_location)
+                
+                s3_key = f"{upload_location['prefix']}{filename}"
+                bucket = upload_location['bucket']
+                
+                self._log_debug(f"S3 upload details - Bucket: {bucket}, Key: {s3_key}")
+                
+                presigned_location = None
+                if file_size < self.transfer_config.multipart_threshold:
+                    # Single-part upload: sign a PUT locally and stream the
+                    # file, skipping s3transfer's per-upload setup
+                    presigned_location = {'url': s3_client.generate_presigned_url(
+                        'put_object',
+                        Params={'Bucket': bucket, 'Key': s3_key},
+                        ExpiresIn=3600
+                    )}
             
-            def upload_callback(bytes_transferred):
-                uploaded_bytes[0] += bytes_transferred
-                progress = (uploaded_bytes[0] / file_size) * 100
-                if uploaded_bytes[0] % (1024 * 1024) == 0:  # Log every MB
-                    self._log("debug", f"Upload progress for {filename}: {progress:.1f}%")
+            # Track upload progress only when it can be logged, so boto3 has
+            # no callback to invoke otherwise. Progress is a debug message,
+            # logged only with CESIUM_DEBUG=1.
+            upload_callback = None
+            if presigned_location is None and self._log_debug is not _noop:
+                # [bytes uploaded, time of last progress log]
+                progress_state = [0, time.monotonic()]
+                
+                def log_progress(bytes_transferred):
+                    progress_state[0] += bytes_transferred
+                    now = time.monotonic()
+                    if now - progress_state[1] >= UPLOAD_PROGRESS_LOG_INTERVAL:
+                        progress_state[1] = now
+                        progress = (progress_state[0] / file_size) * 100
+                        self._log_debug(f"Upload progress for {filename}: {progress:.1f}%")
+                
+                upload_callback = log_progress
             
-            start_time = time.time()
-            s3_client.upload_file(
-                file_path,
-                bucket,
-                s3_key,
-                Callback=upload_callback
-            )
+            # Wait for a free transfer slot so S3 uploads stay bounded even
+            # when many workers are busy with API calls
+            with self._transfer_slots:
+                start_time = time.time()
+                
+                if presigned_location is not None:
+                    self._upload_file_presigned(file_path, filename, presigned_location)
+                elif metadata is not None:
+                    self._upload_file_multipart(s3_client, file_path, filename, bucket, s3_key, metadata, upload_callback, file_stat)
+                else:
+                    s3_client.upload_file(
+                        file_path,
+                        bucket,
+                        s3_key,
+                        Callback=upload_callback,
+                        Config=self.transfer_config
+                    )
             
             upload_time = time.time() - start_time
             upload_speed = file_size_mb / upload_time if upload_time > 0 else 0
             
-            self._log("info", f"✅ Successfully uploaded {filename} to S3 in {upload_time:.2f}s (Speed: {upload_speed:.2f} MB/s)")
+            self._log_info(f"✅ Successfully uploaded {filename} to S3 in {upload_time:.2f}s (Speed: {upload_speed:.2f} MB/s)")
             return True
             
         except Exception as e:
-            self._log("error", f"❌ Error uploading {filename} to S3: {str(e)}")
-            print(f"Error uploading to S3: {str(e)}")
+            self._log_error(f"❌ Error uploading {filename} to S3: {str(e)}")
             return False
 
     def notify_upload_complete(self, on_complete: Dict) -> bool:
@@ -284,28 +1114,123 @@ class CesiumAPIHelper:
         Returns:
             True if notification successful, False otherwise
         """
-        self._log("info", "Step 3: Notifying Cesium ION that upload is complete")
+        self._log_info("Step 3: Notifying Cesium ION that upload is complete")
         
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=on_complete['method'],
                 url=on_complete['url'],
-                headers=self.headers,
                 json=on_complete['fields'],
                 timeout=30
             )
             response.raise_for_status()
-            self._log("info", "✅ Upload completion notification sent successfully")
+            self._log_info("✅ Upload completion notification sent successfully")
             return True
             
         except requests.exceptions.RequestException as e:
-            self._log("error", f"❌ Error notifying upload complete: {str(e)}")
-            print(f"Error notifying upload complete: {str(e)}")
+            self._log_error(f"❌ Error notifying upload complete: {str(e)}")
             return False
 
+    def _watch_asset_processing(self, asset_id: str) -> Future:
+        """
+        Register an asset with the shared status poller.
+        
+        Args:
+            asset_id: ID of the asset to watch
+            
+        Returns:
+            Future resolved with the final processing status of the asset
+        """
+        with self._status_lock:
+            future = self._status_futures.get(asset_id)
+            if future is None:
+                future = Future()
+                self._status_futures[asset_id] = future
+                self._poll_wakeup.set()
+            
+            # Start the poller lazily on first registration
+            if self._poller_thread is None:
+                self._poller_thread = threading.Thread(
+                    target=self._poll_processing_statuses,
+                    name="cesium-status-poller",
+                    daemon=True
+                )
+                self._poller_thread.start()
+        
+        return future
+
+    def _poll_processing_statuses(self) -> None:
+        """
+        Poll the asset list once per interval for every watched asset.
+        
+        One GET /v1/assets call serves all waiting uploads instead of each
+        worker polling its own asset. Assets missing from the listing are
+        checked individually.
+        """
+        delay = PROCESSING_POLL_INITIAL_DELAY
+        watched_count = 0
+        last_statuses: Dict[str, str] = {}
+        
+        while True:
+            with self._status_lock:
+                pending = dict(self._status_futures)
+                if not pending:
+                    self._poller_thread = None
+                    return
+            
+            # Forget assets whose waiters gave up
+            last_statuses = {k: v for k, v in last_statuses.items() if k in pending}
+            
+            # Check newly registered assets promptly
+            if len(pending) > watched_count:
+                delay = PROCESSING_POLL_INITIAL_DELAY
+            
+            try:
+                assets = self.get_cesium_ion_assets_list()
+                if not assets:
+                    # The listing failed (watched assets exist, so it cannot
+                    # be empty). Wait for the next tick instead of falling
+                    # back to one request per pending asset.
+                    self._log_warning(f"Asset list unavailable, retrying status poll for {len(pending)} assets")
+                    watched_count = len(pending)
+                    delay = sleep_with_backoff(delay, PROCESSING_POLL_MAX_DELAY, self._poll_wakeup)
+                    continue
+                
+                # Index only the watched assets rather than the whole account
+                assets_by_id = {}
+                for asset in assets:
+                    asset_id = str(asset.get('id'))
+                    if asset_id in pending:
+                        assets_by_id[asset_id] = asset
+                
+                for asset_id, future in pending.items():
+                    asset = assets_by_id.get(asset_id) or self.get_asset_status(asset_id)
+                    if not asset:
+                        self._log_error("Failed to fetch status for asset %s", asset_id)
+                        status = "ERROR_FETCHING_STATUS"
+                    else:
+                        status = asset.get('status', 'UNKNOWN')
+                        if status != last_statuses.get(asset_id):
+                            self._log_info("Asset %s status changed to: %s", asset_id, status)
+                            last_statuses[asset_id] = status
+                        if status not in PROCESSING_FINAL_STATUSES:
+                            continue
+                    
+                    with self._status_lock:
+                        self._status_futures.pop(asset_id, None)
+                    future.set_result(status)
+                    
+            except Exception as e:
+                self._log_error(f"Error polling asset statuses: {str(e)}")
+            
+            watched_count = len(pending)
+            delay = sleep_with_backoff(delay, PROCESSING_POLL_MAX_DELAY, self._poll_wakeup)
+
     def wait_for_processing(self, asset_id: str, timeout: int = 900) -> Tuple[bool, str]:
         """
-        Step 4: Monitor asset processing status.
+        Step 4: Wait for asset processing using the shared status poller.
+        
+        Concurrent waiters share one asset list request per poll interval.
         
         Args:
             asset_id: ID of the asset to monitor
@@ -314,51 +1239,27 @@ class CesiumAPIHelper:
         Returns:
             Tuple of (success, final_status)
         """
-        self._log("info", f"Step 4: Monitoring processing status for asset {asset_id} (timeout: {timeout}s)")
+        self._log_info(f"Step 4: Waiting for processing of asset {asset_id} (timeout: {timeout}s)")
         start_time = time.time()
-        last_status = None
         
-        while time.time() - start_time < timeout:
-            try:
-                asset = self.get_asset_status(asset_id)
-                if not asset:
-                    self._log("error", f"Failed to fetch status for asset {asset_id}")
-                    return False, "ERROR_FETCHING_STATUS"
-                
-                status = asset.get('status', 'UNKNOWN')
-                
-                # Log status changes
-                if status != last_status:
-                    elapsed = time.time() - start_time
-                    self._log("info", f"Asset {asset_id} status changed to: {status} (after {elapsed:.1f}s)")
-                    last_status = status
-                
-                if status == 'COMPLETE':
-                    elapsed = time.time() - start_time
-                    self._log("info", f"✅ Asset {asset_id} processing completed successfully in {elapsed:.1f}s")
-                    return True, status
-                elif status in ['ERROR', 'DATA_ERROR']:
-                    elapsed = time.time() - start_time
-                    self._log("error", f"❌ Asset {asset_id} processing failed with status: {status} (after {elapsed:.1f}s)")
-                    return False, status
-                elif status in ['AWAITING_FILES', 'NOT_STARTED', 'IN_PROGRESS']:
-                    # Still processing, wait and check again
-                    time.sleep(10)
-                else:
-                    # Unknown status, continue waiting
-                    self._log("warning", f"Unknown status '{status}' for asset {asset_id}, continuing to wait...")
-                    time.sleep(10)
-                    
-            except Exception as e:
-                self._log("error", f"Error checking status for asset {asset_id}: {str(e)}")
-                print(f"Error checking status: {str(e)}")
-                time.sleep(10)
+        try:
+            status = self._watch_asset_processing(asset_id).result(timeout=timeout)
+        except FutureTimeoutError:
+            with self._status_lock:
+                self._status_futures.pop(asset_id, None)
+            elapsed = time.time() - start_time
+            self._log_error(f"❌ Timeout waiting for asset {asset_id} processing (waited {elapsed:.1f}s)")
+            return False, "TIMEOUT"
         
         elapsed = time.time() - start_time
-        self._log("error", f"❌ Timeout waiting for asset {asset_id} processing (waited {elapsed:.1f}s)")
-        return False, "TIMEOUT"
+        if status == 'COMPLETE':
+            self._log_info(f"✅ Asset {asset_id} processing completed successfully in {elapsed:.1f}s")
+            return True, status
+        
+        self._log_error(f"❌ Asset {asset_id} processing failed with status: {status} (after {elapsed:.1f}s)")
+        return False, status
 
-    def upload_gml_file(self, file_path: str, wait_for_completion: bool = False, create_archive: bool = False, download_archive: bool = False) -> Tuple[str, bool, str, Optional[str]]:
+    def upload_gml_file(self, file_path: str, wait_for_completion: bool = False, create_archive: bool = False, download_archive: bool = False, get_metadata: Optional[Callable[[], Optional[Dict]]] = None) -> Tuple[str, bool, str, Optional[str]]:
         """
         Complete upload workflow for a GML file with optional archive creation and download.
         
@@ -367,18 +1268,41 @@ class CesiumAPIHelper:
             wait_for_completion: Whether to wait for processing to complete
             create_archive: Whether to create archive after successful processing
             download_archive: Whether to download archive after successful creation
+            get_metadata: Optional callable returning the step 1 response when it
+                was already requested ahead of time; step 1 runs inline otherwise
             
         Returns:
             Tuple of (filename, success_status, message, asset_id)
         """
-        filename = Path(file_path).name
-        self._log("info", f"Starting upload workflow for {filename}")
+        filename, success, message, asset_id = self._upload_and_notify(file_path, get_metadata)
+        if success and wait_for_completion:
+            return self._complete_processing(filename, asset_id, create_archive, download_archive)
+        return filename, success, message, asset_id
+    
+    def _upload_and_notify(self, file_path: str, get_metadata: Optional[Callable[[], Optional[Dict]]] = None) -> Tuple[str, bool, str, Optional[str]]:
+        """
+        Run steps 1-3 of the upload workflow for a GML file.
+        
+        Args:
+            file_path: Path to the GML file to upload
+            get_metadata: Optional callable returning the step 1 response when it
+                was already requested ahead of time; step 1 runs inline otherwise
+            
+        Returns:
+            Tuple of (filename, success_status, message, asset_id)
+        """
+        filename = os.path.basename(file_path)
+        stem = os.path.splitext(filename)[0]
+        self._log_info(f"Starting upload workflow for {filename}")
         
         try:
             # Step 1: Create asset metadata
-            response = self.create_asset_metadata(file_path)
+            if get_metadata is not None:
+                response = get_metadata()
+            else:
+                response = self._prepare_upload(file_path, filename, stem)
             if not response:
-                self._log("error", f"Upload workflow failed for {filename}: Failed to create asset metadata")
+                self._log_error(f"Upload workflow failed for {filename}: Failed to create asset metadata")
                 return filename, False, "Failed to create asset metadata", None
             
             asset_id = response['assetMetadata']['id']
@@ -386,54 +1310,69 @@ class CesiumAPIHelper:
             on_complete = response['onComplete']
             
             # Step 2: Upload file to S3
-            if not self.upload_file_to_s3(file_path, upload_location):
-                self._log("error", f"Upload workflow failed for {filename}: Failed to upload file to S3")
+            if not self.upload_file_to_s3(file_path, upload_location, filename, response):
+                self._log_error(f"Upload workflow failed for {filename}: Failed to upload file to S3")
                 return filename, False, "Failed to upload file to S3", str(asset_id)
             
-            # Step 3: Notify upload complete
+            # Step 3: Notify upload complete. Connection failures and rate
+            # limiting are retried by the session (ApiRetry). If it still
+            # fails, a multipart upload's checkpoint is kept, so the next
+            # run goes straight back to this step without uploading again.
             if not self.notify_upload_complete(on_complete):
-                self._log("error", f"Upload workflow failed for {filename}: Failed to notify upload completion")
+                self._log_error(f"Upload workflow failed for {filename}: Failed to notify upload completion")
                 return filename, False, "Failed to notify upload completion", str(asset_id)
+            self._clear_upload_state(filename)
             
-            # Step 4: Optionally wait for processing
-            if wait_for_completion:
-                self._log("info", f"Waiting for processing completion for {filename} (Asset ID: {asset_id})")
-                success, final_status = self.wait_for_processing(str(asset_id))
-                if success:
-                    # Step 5: Optionally create archive after successful processing
-                    if create_archive:
-                        self._log("info", f"Creating archive for {filename} (Asset ID: {asset_id})")
-                        archive_success, archive_id, archive_message = self.create_archive(str(asset_id))
+            self._log_info(f"✅ Upload workflow completed for {filename} (Asset ID: {asset_id})")
+            return filename, True, f"Upload initiated successfully (Asset ID: {asset_id})", str(asset_id)
+                
+        except Exception as e:
+            self._log_error(f"❌ Unexpected error in upload workflow for {filename}: {str(e)}")
+            return filename, False, f"Unexpected error: {str(e)}", None
+    
+    def _complete_processing(self, filename: str, asset_id: str, create_archive: bool = False, download_archive: bool = False) -> Tuple[str, bool, str, Optional[str]]:
+        """
+        Run steps 4-6 of the upload workflow for an uploaded GML file.
+        
+        Args:
+            filename: Name of the uploaded GML file
+            asset_id: ID of the asset created for the file
+            create_archive: Whether to create archive after successful processing
+            download_archive: Whether to download archive after successful creation
+            
+        Returns:
+            Tuple of (filename, success_status, message, asset_id)
+        """
+        try:
+            # Step 4: Wait for processing
+            self._log_info(f"Waiting for processing completion for {filename} (Asset ID: {asset_id})")
+            success, final_status = self.wait_for_processing(str(asset_id))
+            if success:
+                # Step 5: Optionally create archive after successful processing
+                if create_archive:
+                    self._log_info(f"Creating archive for {filename} (Asset ID: {asset_id})")
+                    archive_success, archive_id, archive_message = self.create_archive(str(asset_id))
+                    
+                    if archive_success and archive_id:
+                        # Wait for archive completion
+                        archive_completed, archive_status = self.wait_for_archive_completion(archive_id)
                         
-                        if archive_success and archive_id:
-                            # Wait for archive completion
-                            archive_completed, archive_status = self.wait_for_archive_completion(archive_id)
-                            
-                            if archive_completed:
-                                # Step 6: Optionally download the archive
-                                if download_archive:
-                                    self._log("info", f"Downloading archive for {filename} (Archive ID: {archive_id})")
-                                    download_success, download_path = self.download_archive(archive_id)
-                                    
-                                    if download_success:
-                                        archive_info = {
-                                            'file': filename,
-                                            'asset_id': str(asset_id),
-                                            'archive_id': archive_id,
-                                            'download_path': download_path
-                                        }
-                                        self.results['archived'].append(archive_info)
-                                        self._log("info", f"✅ Complete workflow with archive download success for {filename} (Asset ID: {asset_id}, Archive ID: {archive_id}, Downloaded to: {download_path})")
-                                        return filename, True, f"Upload, processing, archive creation and download completed successfully (Asset ID: {asset_id}, Archive ID: {archive_id}, Downloaded to: {download_path})", str(asset_id)
-                                    else:
-                                        archive_info = {
-                                            'file': filename,
-                                            'asset_id': str(asset_id),
-                                            'archive_id': archive_id,
-                                        }
-                                        self.results['archived'].append(archive_info)
-                                        self._log("warning", f"⚠️ Archive created but download failed for {filename} (Asset ID: {asset_id}, Archive ID: {archive_id})")
-                                        return filename, True, f"Upload, processing, and archive completed successfully, but download failed (Asset ID: {asset_id}, Archive ID: {archive_id})", str(asset_id)
+                        if archive_completed:
+                            # Step 6: Optionally download the archive
+                            if download_archive:
+                                self._log_info(f"Downloading archive for {filename} (Archive ID: {archive_id})")
+                                download_success, download_path = self.download_archive(archive_id)
+                                
+                                if download_success:
+                                    archive_info = {
+                                        'file': filename,
+                                        'asset_id': str(asset_id),
+                                        'archive_id': archive_id,
+                                        'download_path': download_path
+                                    }
+                                    self.results['archived'].append(archive_info)
+                                    self._log_info(f"✅ Complete workflow with archive download success for {filename} (Asset ID: {asset_id}, Archive ID: {archive_id}, Downloaded to: {download_path})")
+                                    return filename, True, f"Upload, processing, archive creation and download completed successfully (Asset ID: {asset_id}, Archive ID: {archive_id}, Downloaded to: {download_path})", str(asset_id)
                                 else:
                                     archive_info = {
                                         'file': filename,
@@ -441,45 +1380,147 @@ class CesiumAPIHelper:
                                         'archive_id': archive_id,
                                     }
                                     self.results['archived'].append(archive_info)
-                                    self._log("info", f"✅ Complete workflow with archive success for {filename} (Asset ID: {asset_id}, Archive ID: {archive_id})")
-                                    return filename, True, f"Upload, processing, and archive completed successfully (Asset ID: {asset_id}, Archive ID: {archive_id})", str(asset_id)
+                                    self._log_warning(f"⚠️ Archive created but download failed for {filename} (Asset ID: {asset_id}, Archive ID: {archive_id})")
+                                    return filename, True, f"Upload, processing, and archive completed successfully, but download failed (Asset ID: {asset_id}, Archive ID: {archive_id})", str(asset_id)
                             else:
-                                self._log("warning", f"⚠️ Processing succeeded but archive creation failed for {filename} (Asset ID: {asset_id})")
-                                return filename, True, f"Upload and processing completed, but archive failed with status: {archive_status} (Asset ID: {asset_id})", str(asset_id)
+                                archive_info = {
+                                    'file': filename,
+                                    'asset_id': str(asset_id),
+                                    'archive_id': archive_id,
+                                }
+                                self.results['archived'].append(archive_info)
+                                self._log_info(f"✅ Complete workflow with archive success for {filename} (Asset ID: {asset_id}, Archive ID: {archive_id})")
+                                return filename, True, f"Upload, processing, and archive completed successfully (Asset ID: {asset_id}, Archive ID: {archive_id})", str(asset_id)
                         else:
-                            self._log("warning", f"⚠️ Processing succeeded but archive creation failed for {filename} (Asset ID: {asset_id})")
-                            return filename, True, f"Upload and processing completed, but archive creation failed: {archive_message} (Asset ID: {asset_id})", str(asset_id)
+                            self._log_warning(f"⚠️ Processing succeeded but archive creation failed for {filename} (Asset ID: {asset_id})")
+                            return filename, True, f"Upload and processing completed, but archive failed with status: {archive_status} (Asset ID: {asset_id})", str(asset_id)
                     else:
-                        self._log("info", f"✅ Complete workflow success for {filename} (Asset ID: {asset_id})")
-                        return filename, True, f"Upload and processing completed successfully (Asset ID: {asset_id})", str(asset_id)
+                        self._log_warning(f"⚠️ Processing succeeded but archive creation failed for {filename} (Asset ID: {asset_id})")
+                        return filename, True, f"Upload and processing completed, but archive creation failed: {archive_message} (Asset ID: {asset_id})", str(asset_id)
                 else:
-                    self._log("warning", f"⚠️ Upload succeeded but processing failed for {filename} (Asset ID: {asset_id}, Status: {final_status})")
-                    return filename, False, f"Upload succeeded but processing failed with status: {final_status} (Asset ID: {asset_id})", str(asset_id)
+                    self._log_info(f"✅ Complete workflow success for {filename} (Asset ID: {asset_id})")
+                    return filename, True, f"Upload and processing completed successfully (Asset ID: {asset_id})", str(asset_id)
             else:
-                self._log("info", f"✅ Upload workflow completed for {filename} (Asset ID: {asset_id}) - processing will continue in background")
-                return filename, True, f"Upload initiated successfully (Asset ID: {asset_id})", str(asset_id)
+                self._log_warning(f"⚠️ Upload succeeded but processing failed for {filename} (Asset ID: {asset_id}, Status: {final_status})")
+                return filename, False, f"Upload succeeded but processing failed with status: {final_status} (Asset ID: {asset_id})", str(asset_id)
                 
         except Exception as e:
-            self._log("error", f"❌ Unexpected error in upload workflow for {filename}: {str(e)}")
-            return filename, False, f"Unexpected error: {str(e)}", None
+            self._log_error(f"❌ Unexpected error in upload workflow for {filename}: {str(e)}")
+            return filename, False, f"Unexpected error: {str(e)}", asset_id
+    
+    def load_results_log(self) -> Dict[str, Dict]:
+        """
+        Read the results log and return the latest record of every file.
+        
+        Each record's 'step' names the stage it reports on: 'uploaded'
+        (steps 1-3) or 'processed' (steps 4-6, logged when waiting for
+        processing). With waiting, a confirmed upload is logged before
+        processing starts and again when it ends, so later records replace
+        earlier ones.
+        
+        Returns:
+            Dictionary mapping filename to its most recent record
+        """
+        records = {}
+        if not self.results_log_path.exists():
+            return records
+        
+        with open(self.results_log_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Ignore a partially written last line
+                    continue
+                records[record.get('file')] = record
+        return records
     
-    def upload_files_parallel(self, file_paths: List[str], max_workers: int = 10, wait_for_completion: bool = False, create_archive: bool = False, download_archive: bool = False) -> None:
+    def upload_files_parallel(self, file_paths: List[str], max_workers: Optional[int] = None, wait_for_completion: bool = False, create_archive: bool = False, download_archive: bool = False, force: bool = False) -> None:
         """
         Upload files in parallel with progress bar and optional archive creation and download.
         
+        Results are appended to the results log as they complete so that an
+        interrupted run can be resumed without re-uploading finished files.
+        
         Args:
             file_paths: List of file paths to upload
             max_workers: Maximum number of concurrent uploads
+                (default: the max_workers the helper was created with)
             wait_for_completion: Whether to wait for processing to complete
             create_archive: Whether to create archives after successful processing
             download_archive: Whether to download archives after successful creation
+            force: Upload files even if the results log shows them as uploaded
+                or a completed Cesium ION asset with the same name exists
         """
-        self._log("info", f"=== Starting parallel upload session ===")
-        self._log("info", f"Files to upload: {len(file_paths)}")
-        self._log("info", f"Max workers: {max_workers}")
-        self._log("info", f"Wait for completion: {wait_for_completion}")
-        self._log("info", f"Create archives: {create_archive}")
-        self._log("info", f"Download archives: {download_archive}")
+        self._log_info(f"=== Starting parallel upload session ===")
+        
+        # Files uploaded by an interrupted run that still need steps 4-6,
+        # as (filename, asset_id)
+        resume_processing: List[Tuple[str, str]] = []
+        
+        if not force:
+            records = self.load_results_log()
+            already_uploaded = {filename for filename, record in records.items() if record.get('ok')}
+            self._log_info(f"Found {len(already_uploaded)} previously uploaded files in {self.results_log_path}")
+            
+            # Assets already processed on Cesium ION, indexed by name once
+            completed_asset_names = {
+                asset.get('name') for asset in self.get_cesium_ion_assets_list()
+                if asset.get('status') == 'COMPLETE'
+            }
+            
+            remaining = []
+            for file_path in file_paths:
+                filename = os.path.basename(file_path)
+                stem = os.path.splitext(filename)[0]
+                record = records.get(filename)
+                if (wait_for_completion and stem not in completed_asset_names
+                        and record and record.get('ok') and record.get('step') == 'uploaded'):
+                    # Already in S3 and confirmed; only the wait remains
+                    resume_processing.append((filename, record['asset_id']))
+                elif filename in already_uploaded or stem in completed_asset_names:
+                    self.results['skipped'].append(filename)
+                else:
+                    remaining.append(file_path)
+            
+            if self.results['skipped']:
+                print(f"⏭️ Skipping {len(self.results['skipped'])} files already uploaded (see {self.results_log_path} and Cesium ION, use --force to re-upload)")
+                if self.enable_logging:
+                    self._log_info(f"Skipping already uploaded files: {self.results['skipped']}")
+            if resume_processing:
+                print(f"⏩ Resuming processing of {len(resume_processing)} files uploaded by an interrupted run")
+                self._log_info(f"Resuming processing without re-upload: {[filename for filename, _ in resume_processing]}")
+            file_paths = remaining
+        
+        if not file_paths and not resume_processing:
+            print("✅ Nothing to upload")
+            self._log_info("No files left to upload")
+            return
+        
+        # Largest files first, so a big upload does not start last and
+        # leave the other workers idle at the end of the batch
+        file_sizes = {file_path: os.path.getsize(file_path) for file_path in file_paths}
+        file_paths = sorted(file_paths, key=file_sizes.__getitem__, reverse=True)
+        total_bytes = sum(file_sizes.values())
+        
+        # More workers than files would only start idle threads
+        if max_workers is None:
+            max_workers = self.max_workers
+        max_workers = max(1, min(max_workers, len(file_paths)))
+        
+        # Grow the connection pools if this run uses more workers than
+        # they were sized for
+        if max_workers > self._pool_workers:
+            self._mount_session_adapters(max_workers)
+        
+        # Results expected: one per uploaded file and per resumed file
+        task_count = len(file_paths) + len(resume_processing)
+        
+        self._log_info(f"Files to upload: {len(file_paths)}")
+        self._log_info(f"Max workers: {max_workers}")
+        self._log_info(f"Wait for completion: {wait_for_completion}")
+        self._log_info(f"Create archives: {create_archive}")
+        self._log_info(f"Download archives: {download_archive}")
         
         print(f"\n🚀 Starting upload of {len(file_paths)} GML files to Cesium ION...")
         if wait_for_completion:
@@ -490,163 +1531,262 @@ class CesiumAPIHelper:
             print("📥 Will download archives after creation...")
         
         start_time = time.time()
+        success_count = 0
+        failed_count = 0
+        
+        # Step 1 runs in a small pool ahead of the upload workers, so a worker
+        # finishing one file already has credentials for the next. Metadata is
+        # only requested max_workers files ahead of the workers, which keeps
+        # the temporary upload credentials fresh.
+        metadata_futures: List[Optional[Future]] = [None] * len(file_paths)
+        next_metadata_index = 0
+        metadata_lock = threading.Lock()
+        
+        def take_metadata(index: int) -> Optional[Dict]:
+            nonlocal next_metadata_index
+            with metadata_lock:
+                lookahead_end = min(len(file_paths), index + 1 + max_workers)
+                while next_metadata_index < lookahead_end:
+                    metadata_futures[next_metadata_index] = metadata_executor.submit(
+                        self._prepare_upload, file_paths[next_metadata_index]
+                    )
+                    next_metadata_index += 1
+                metadata_future = metadata_futures[index]
+                # Each response is taken once; dropping the reference keeps
+                # only the lookahead window of credentials in memory
+                metadata_futures[index] = None
+            return metadata_future.result()
+        
+        # Finished futures are handed to this queue by the workers, so
+        # results are consumed in completion order without as_completed
+        completed_futures = queue.SimpleQueue()
+        
+        # Results are written from the main thread and, for confirmed
+        # uploads, from the upload callbacks
+        results_log_lock = threading.Lock()
+        
+        def log_result(filename: str, success: bool, message: str, asset_id: Optional[str], step: str) -> None:
+            with results_log_lock:
+                results_log.write(json.dumps({
+                    'file': filename,
+                    'ok': success,
+                    'step': step,
+                    'message': message,
+                    'asset_id': asset_id,
+                    'timestamp': datetime.now().isoformat()
+                }) + '\n')
+        
+        def start_processing(filename: str, asset_id: str) -> None:
+            # Steps 4-6 only wait on Cesium ION, so they run in their own pool
+            # and the upload worker moves straight on to the next file
+            processing_future = processing_executor.submit(
+                self._complete_processing,
+                filename,
+                asset_id,
+                create_archive,
+                download_archive
+            )
+            processing_future.add_done_callback(completed_futures.put)
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(self.upload_gml_file, file_path, wait_for_completion, create_archive, download_archive): file_path 
-                for file_path in file_paths
-            }
+        def continue_processing(upload_future: Future) -> None:
+            if upload_future.exception() is None:
+                filename, success, message, asset_id = upload_future.result()
+                if success:
+                    # Record the upload before the potentially long wait, so
+                    # an interrupted run resumes at step 4 instead of
+                    # uploading the file again
+                    log_result(filename, True, message, asset_id, 'uploaded')
+                    start_processing(filename, asset_id)
+                    return
+            completed_futures.put(upload_future)
+        
+        # Only a bounded number of uploads wait in the executor queue at a
+        # time; a slot is freed as soon as an upload finishes
+        upload_slots = threading.BoundedSemaphore(max_workers * 2)
+        
+        def on_upload_done(upload_future: Future) -> None:
+            upload_slots.release()
+            if wait_for_completion:
+                continue_processing(upload_future)
+            else:
+                completed_futures.put(upload_future)
+        
+        def submit_uploads() -> None:
+            # Metadata is requested in the same order as files are submitted
+            for index, file_path in enumerate(file_paths):
+                upload_slots.acquire()
+                future = executor.submit(
+                    self._upload_and_notify,
+                    file_path,
+                    partial(take_metadata, index)
+                )
+                future.add_done_callback(on_upload_done)
+            self._log_info(f"Submitted {len(file_paths)} upload tasks to thread pool")
+        
+        # The results log is opened first so it is closed last: if the loop
+        # below is interrupted, the executors finish their running tasks on
+        # exit and those still record their results
+        with open(self.results_log_path, 'a', encoding='utf-8', buffering=1) as results_log, \
+                ThreadPoolExecutor(max_workers=METADATA_WORKERS, thread_name_prefix='cesium-metadata') as metadata_executor, \
+                ThreadPoolExecutor(max_workers=PROCESSING_WORKERS, thread_name_prefix='cesium-processing') as processing_executor, \
+                ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='cesium-upload') as executor:
+            for filename, asset_id in resume_processing:
+                start_processing(filename, asset_id)
             
-            self._log("info", f"Submitted {len(future_to_file)} upload tasks to thread pool")
+            # Feed the upload pool from a separate thread so results are
+            # consumed while files are still being submitted
+            threading.Thread(target=submit_uploads, name='cesium-submit', daemon=True).start()
             
             # Process completed tasks with progress bar
-            with tqdm(total=len(file_paths), desc="Uploading files", unit="file") as pbar:
-                for future in as_completed(future_to_file):
-                    filename, success, message, asset_id = future.result()
+            # tqdm coalesces bursts of completions into one redraw per interval
+            with tqdm(total=task_count, desc="Uploading files", unit="file",
+                      mininterval=PROGRESS_REFRESH_INTERVAL, smoothing=0.1) as pbar:
+                for _ in range(task_count):
+                    filename, success, message, asset_id = completed_futures.get().result()
+                    
+                    # Persist each result as soon as it is known
+                    log_result(filename, success, message, asset_id, 'processed' if wait_for_completion else 'uploaded')
+                    
+                    self.results['uploads'].append(UploadResult(filename, success, message, asset_id))
                     
                     if success:
-                        result_data = {
-                            'file': filename, 
-                            'message': message, 
-                            'asset_id': asset_id
-                        }
-                        self.results['success'].append(result_data)
-                        self._log("info", f"✅ Upload completed successfully: {filename} -> Asset ID: {asset_id}")
-                        pbar.set_postfix_str(f"✅ {filename}")
+                        success_count += 1
+                        self._log_info(f"✅ Upload completed successfully: {filename} -> Asset ID: {asset_id}")
                     else:
-                        result_data = {
-                            'file': filename, 
-                            'error': message, 
-                            'asset_id': asset_id
-                        }
-                        self.results['failed'].append(result_data)
-                        self._log("error", f"❌ Upload failed: {filename} - {message}")
-                        pbar.set_postfix_str(f"❌ {filename}")
+                        failed_count += 1
+                        self._log_error(f"❌ Upload failed: {filename} - {message}")
+                        # Only failures are shown next to the bar; the redraw
+                        # happens in update()
+                        pbar.set_postfix_str(f"❌ {filename}", refresh=False)
                     
                     pbar.update(1)
         
         total_time = time.time() - start_time
-        success_count = len(self.results['success'])
-        failed_count = len(self.results['failed'])
         archived_count = len(self.results['archived'])
         
-        self._log("info", f"=== Upload session completed ===")
-        self._log("info", f"Total time: {total_time:.2f} seconds")
-        self._log("info", f"Successful uploads: {success_count}")
-        self._log("info", f"Failed uploads: {failed_count}")
-        self._log("info", f"Archived assets: {archived_count}")
-        self._log("info", f"Success rate: {(success_count / len(file_paths)) * 100:.1f}%")
+        self._log_info(f"=== Upload session completed ===")
+        self._log_info(f"Total time: {total_time:.2f} seconds")
+        # Aggregate rate to compare runs with different --workers and
+        # CESIUM_MAX_TRANSFERS settings on a given network. With --wait the
+        # total includes processing time, so it says nothing about the link.
+        if total_time > 0 and not wait_for_completion:
+            self._log_info(f"Average throughput: {total_bytes / (1024 * 1024) / total_time:.2f} MB/s over {max_workers} workers")
+        self._log_info(f"Successful uploads: {success_count}")
+        self._log_info(f"Failed uploads: {failed_count}")
+        self._log_info(f"Archived assets: {archived_count}")
+        self._log_info(f"Success rate: {(success_count / task_count) * 100:.1f}%")
     
     def print_summary(self) -> None:
         """Print a summary of upload results including archive and download information."""
-        total_files = len(self.results['success']) + len(self.results['failed'])
-        success_count = len(self.results['success'])
-        failed_count = len(self.results['failed'])
+        # Partition each result list once; counts and sections below are
+        # all derived from these
+        successful = []
+        failed = []
+        for result in self.results['uploads']:
+            (successful if result.ok else failed).append(result)
+        downloaded_archives = []
+        created_only_archives = []
+        for item in self.results['archived']:
+            (downloaded_archives if item.get('download_path') else created_only_archives).append(item)
+        
+        total_files = len(self.results['uploads'])
+        success_count = len(successful)
+        failed_count = len(failed)
         archived_count = len(self.results['archived'])
-        downloaded_count = len([item for item in self.results['archived'] if item.get('download_path')])
+        downloaded_count = len(downloaded_archives)
+        skipped_count = len(self.results['skipped'])
         success_rate = (success_count / total_files * 100) if total_files > 0 else 0
         
         # Log summary to file
-        self._log("info", f"=== FINAL SUMMARY ===")
-        self._log("info", f"Total files processed: {total_files}")
-        self._log("info", f"Successful uploads: {success_count}")
-        self._log("info", f"Failed uploads: {failed_count}")
-        self._log("info", f"Archived assets: {archived_count}")
-        self._log("info", f"Downloaded archives: {downloaded_count}")
-        self._log("info", f"Success rate: {success_rate:.1f}%")
-        
-        print("\n" + "="*60)
-        print("UPLOAD SUMMARY")
-        print("="*60)
-        print(f"Total files processed: {total_files}")
-        print(f"✅ Successful uploads: {success_count}")
-        print(f"❌ Failed uploads: {failed_count}")
-        print(f"📦 Archived assets: {archived_count}")
+        self._log_info(f"=== FINAL SUMMARY ===")
+        self._log_info(f"Total files processed: {total_files}")
+        self._log_info(f"Successful uploads: {success_count}")
+        self._log_info(f"Failed uploads: {failed_count}")
+        self._log_info(f"Archived assets: {archived_count}")
+        self._log_info(f"Downloaded archives: {downloaded_count}")
+        self._log_info(f"Skipped (already uploaded): {skipped_count}")
+        self._log_info(f"Success rate: {success_rate:.1f}%")
+        
+        buf = io.StringIO()
+        print("\n" + "="*60, file=buf)
+        print("UPLOAD SUMMARY", file=buf)
+        print("="*60, file=buf)
+        print(f"Total files processed: {total_files}", file=buf)
+        print(f"✅ Successful uploads: {success_count}", file=buf)
+        print(f"❌ Failed uploads: {failed_count}", file=buf)
+        print(f"📦 Archived assets: {archived_count}", file=buf)
         if downloaded_count > 0:
-            print(f"📥 Downloaded archives: {downloaded_count}")
-        print(f"📊 Success rate: {success_rate:.1f}%")
-        
-        if self.results['success']:
-            print("\n✅ SUCCESSFUL UPLOADS:")
-            print("-" * 40)
-            self._log("info", "Successful uploads details:")
-            for item in self.results['success']:
-                asset_id = item.get('asset_id', 'Unknown')
-                print(f"  • {item['file']} (Asset ID: {asset_id})")
-                print(f"    View: https://ion.cesium.com/assets/{asset_id}")
-                self._log("info", f"  ✅ {item['file']} -> Asset ID: {asset_id}")
+            print(f"📥 Downloaded archives: {downloaded_count}", file=buf)
+        if skipped_count > 0:
+            print(f"⏭️ Skipped (already uploaded): {skipped_count}", file=buf)
+        print(f"📊 Success rate: {success_rate:.1f}%", file=buf)
+        
+        if successful:
+            print("\n✅ SUCCESSFUL UPLOADS:", file=buf)
+            print("-" * 40, file=buf)
+            self._log_info("Successful uploads details:")
+            for item in successful:
+                asset_id = item.asset_id or 'Unknown'
+                print(f"  • {item.file} (Asset ID: {asset_id})", file=buf)
+                print(f"    View: https://ion.cesium.com/assets/{asset_id}", file=buf)
+                self._log_info(f"  ✅ {item.file} -> Asset ID: {asset_id}")
         
         if self.results['archived']:
-            print("\n📦 ARCHIVED ASSETS:")
-            print("-" * 40)
-            self._log("info", "Archived assets details:")
-            downloaded_archives = []
-            created_only_archives = []
-            
-            for item in self.results['archived']:
-                if item.get('download_path'):
-                    downloaded_archives.append(item)
-                else:
-                    created_only_archives.append(item)
+            print("\n📦 ARCHIVED ASSETS:", file=buf)
+            print("-" * 40, file=buf)
+            self._log_info("Archived assets details:")
             
             if downloaded_archives:
-                print("\n📥 DOWNLOADED ARCHIVES:")
-                print("-" * 30)
+                print("\n📥 DOWNLOADED ARCHIVES:", file=buf)
+                print("-" * 30, file=buf)
                 for item in downloaded_archives:
                     asset_id = item.get('asset_id', 'Unknown')
                     archive_id = item.get('archive_id', 'Unknown')
                     download_path = item.get('download_path')
-                    print(f"  • {item['file']} (Asset ID: {asset_id})")
-                    print(f"    Archive ID: {archive_id}")
-                    print(f"    Downloaded to: {download_path}")
-                    print(f"    View Asset: https://ion.cesium.com/assets/{asset_id}")
-                    self._log("info", f"  📥 {item['file']} -> Asset ID: {asset_id}, Archive ID: {archive_id}, Downloaded: {download_path}")
+                    print(f"  • {item['file']} (Asset ID: {asset_id})", file=buf)
+                    print(f"    Archive ID: {archive_id}", file=buf)
+                    print(f"    Downloaded to: {download_path}", file=buf)
+                    print(f"    View Asset: https://ion.cesium.com/assets/{asset_id}", file=buf)
+                    self._log_info(f"  📥 {item['file']} -> Asset ID: {asset_id}, Archive ID: {archive_id}, Downloaded: {download_path}")
             
             if created_only_archives:
-                print("\n📦 CREATED (NOT DOWNLOADED) ARCHIVES:")
-                print("-" * 40)
+                print("\n📦 CREATED (NOT DOWNLOADED) ARCHIVES:", file=buf)
+                print("-" * 40, file=buf)
                 for item in created_only_archives:
                     asset_id = item.get('asset_id', 'Unknown')
                     archive_id = item.get('archive_id', 'Unknown')
-                    print(f"  • {item['file']} (Asset ID: {asset_id})")
-                    print(f"    Archive ID: {archive_id}")
-                    print(f"    View Asset: https://ion.cesium.com/assets/{asset_id}")
-                    self._log("info", f"  📦 {item['file']} -> Asset ID: {asset_id}, Archive ID: {archive_id}")
-        
-        if self.results['failed']:
-            print("\n❌ FAILED UPLOADS:")
-            print("-" * 40)
-            self._log("info", "Failed uploads details:")
-            for item in self.results['failed']:
-                asset_id = item.get('asset_id', 'N/A')
-                print(f"  • {item['file']}: {item['error']}")
-                if asset_id and asset_id != 'N/A':
-                    print(f"    Asset ID: {asset_id}")
-                self._log("error", f"  ❌ {item['file']}: {item['error']} (Asset ID: {asset_id})")
-        
-        print("\n" + "="*60)
+                    print(f"  • {item['file']} (Asset ID: {asset_id})", file=buf)
+                    print(f"    Archive ID: {archive_id}", file=buf)
+                    print(f"    View Asset: https://ion.cesium.com/assets/{asset_id}", file=buf)
+                    self._log_info(f"  📦 {item['file']} -> Asset ID: {asset_id}, Archive ID: {archive_id}")
+        
+        if failed:
+            print("\n❌ FAILED UPLOADS:", file=buf)
+            print("-" * 40, file=buf)
+            self._log_info("Failed uploads details:")
+            for item in failed:
+                print(f"  • {item.file}: {item.message}", file=buf)
+                if item.asset_id:
+                    print(f"    Asset ID: {item.asset_id}", file=buf)
+                self._log_error(f"  ❌ {item.file}: {item.message} (Asset ID: {item.asset_id or 'N/A'})")
+        
+        print("\n" + "="*60, file=buf)
         
         # Log completion
-        self._log("info", "=== Upload session completed ===")
+        self._log_info("=== Upload session completed ===")
         
         # Log path information for user reference
-        logs_dir = Path("logs")
-        if logs_dir.exists():
-            log_files = list(logs_dir.glob("cesium_upload_*.log"))
-            if log_files:
-                latest_log = max(log_files, key=lambda f: f.stat().st_mtime)
-                print(f"📝 Detailed logs saved to: {latest_log}")
-                self._log("info", f"Log file location: {latest_log.absolute()}")
+        if self.log_file_path:
+            print(f"📝 Detailed logs saved to: {self.log_file_path}", file=buf)
+            self._log_info(f"Log file location: {self.log_file_path.absolute()}")
+        
+        # One write for the whole summary instead of one per line
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
     def get_asset_ids_from_results(self) -> List[str]:
         """Get list of asset IDs from successful uploads."""
-        asset_ids = []
-        for item in self.results['success']:
-            asset_id = item.get('asset_id')
-            if asset_id:
-                asset_ids.append(asset_id)
-        return asset_ids
+        return [r.asset_id for r in self.results['uploads'] if r.ok and r.asset_id]
 
     def create_archive(self, asset_id: str) -> Tuple[bool, Optional[str], str]:
         """
@@ -659,40 +1799,59 @@ class CesiumAPIHelper:
         Returns:
             Tuple of (success, archive_id, message)
         """
-        self._log("info", f"Step 5: Creating archive for asset {asset_id}")
+        self._log_info(f"Step 5: Creating archive for asset {asset_id}")
         
-
-        
-        payload = {
-            "type": "FULL",
-            "format": "ZIP",
-            "assetIds": [int(asset_id)]
-        }
-        
-        self._log("debug", f"Archive payload: {json.dumps(payload, indent=2)}")
+        body = ARCHIVE_PAYLOAD_TEMPLATE % int(asset_id)
+        self._log_debug("Archive payload: %s", body)
         
         try:
-            response = requests.post(
+            # The session already sends Content-Type: application/json
+            response = self.session.post(
                 self.api_archive_url,
-                headers=self.headers,
-                json=payload,
+                data=body,
                 timeout=30
             )
             response.raise_for_status()
-            result = response.json()
+            result = parse_json(response)
             archive_id = result.get('id')
             
             if archive_id:
-                self._log("info", f"✅ Archive created successfully for asset {asset_id} (Archive ID: {archive_id})")
+                # A cached archive list no longer includes this one
+                with self._archives_cache_lock:
+                    self._archives_cache = (0.0, None)
+                self._log_info(f"✅ Archive created successfully for asset {asset_id} (Archive ID: {archive_id})")
                 return True, str(archive_id), f"Archive created successfully (Archive ID: {archive_id})"
             else:
-                self._log("error", f"❌ Archive creation returned no ID for asset {asset_id}")
+                self._log_error(f"❌ Archive creation returned no ID for asset {asset_id}")
                 return False, None, "Archive creation returned no ID"
                 
         except requests.exceptions.RequestException as e:
-            self._log("error", f"❌ Error creating archive for asset {asset_id}: {str(e)}")
+            self._log_error(f"❌ Error creating archive for asset {asset_id}: {str(e)}")
             return False, None, f"Error creating archive: {str(e)}"
 
+    def _sleep_before_archive_poll(self, url: str, delay: float, deadline: float) -> float:
+        """
+        Wait before polling an archive URL again.
+        
+        A positive Retry-After hint from the last response is honored, but
+        never shorter than ARCHIVE_POLL_INITIAL_DELAY nor past the deadline.
+        Without one (or with Retry-After: 0 or a past date) the usual
+        jittered backoff applies.
+        
+        Args:
+            url: Polled URL, as passed to _get_json_cached
+            delay: Current backoff delay in seconds
+            deadline: time.time() value at which polling gives up
+            
+        Returns:
+            The backoff delay for the next poll
+        """
+        retry_after = self._retry_after.pop(url, None)
+        if retry_after is None or retry_after <= 0:
+            return sleep_with_backoff(delay, ARCHIVE_POLL_MAX_DELAY)
+        time.sleep(min(max(retry_after, ARCHIVE_POLL_INITIAL_DELAY), max(0.0, deadline - time.time())))
+        return delay
+
     def wait_for_archive_completion(self, archive_id: str, timeout: int = 300) -> Tuple[bool, str]:
         """
         Monitor archive creation status.
@@ -704,52 +1863,137 @@ class CesiumAPIHelper:
         Returns:
             Tuple of (success, final_status)
         """
-        self._log("info", f"Monitoring archive status for archive {archive_id} (timeout: {timeout}s)")
+        self._log_info(f"Monitoring archive status for archive {archive_id} (timeout: {timeout}s)")
         start_time = time.time()
         last_status = None
+        delay = ARCHIVE_POLL_INITIAL_DELAY
+        
+        archive_url = f"{self.api_archive_url}/{archive_id}"
         
         while time.time() - start_time < timeout:
             try:
-                url = f"{self.api_archive_url}/{archive_id}"
-                response = requests.get(
-                    url,
-                    headers=self.headers,
-                    timeout=30
-                )
-                response.raise_for_status()
-                archive_data = response.json()
+                # Revalidated with the last ETag, so unchanged polls come
+                # back as a bodiless 304 on the pooled connection
+                archive_data = self._get_json_cached(archive_url)
                 status = archive_data.get('status', 'UNKNOWN')
                 
-                # Log status changes
+                # Log status changes. Progress means completion may be
+                # close, so polling speeds up again.
                 if status != last_status:
                     elapsed = time.time() - start_time
-                    self._log("info", f"Archive {archive_id} status changed to: {status} (after {elapsed:.1f}s)")
+                    self._log_info(f"Archive {archive_id} status changed to: {status} (after {elapsed:.1f}s)")
                     last_status = status
+                    delay = ARCHIVE_POLL_INITIAL_DELAY
                 
                 if status == 'COMPLETE':
                     elapsed = time.time() - start_time
-                    self._log("info", f"✅ Archive {archive_id} creation completed successfully in {elapsed:.1f}s")
+                    self._log_info(f"✅ Archive {archive_id} creation completed successfully in {elapsed:.1f}s")
                     return True, status
                 elif status in ['ERROR', 'FAILED']:
                     elapsed = time.time() - start_time
-                    self._log("error", f"❌ Archive {archive_id} creation failed with status: {status} (after {elapsed:.1f}s)")
+                    self._log_error(f"❌ Archive {archive_id} creation failed with status: {status} (after {elapsed:.1f}s)")
                     return False, status
-                elif status in ['PENDING', 'IN_PROGRESS', 'PROCESSING']:
-                    # Still processing, wait and check again
-                    time.sleep(5)
-                else:
+                elif status not in ['PENDING', 'IN_PROGRESS', 'PROCESSING']:
                     # Unknown status, continue waiting
-                    self._log("warning", f"Unknown archive status '{status}' for archive {archive_id}, continuing to wait...")
-                    time.sleep(5)
+                    self._log_warning(f"Unknown archive status '{status}' for archive {archive_id}, continuing to wait...")
                     
             except Exception as e:
-                self._log("error", f"Error checking archive status for {archive_id}: {str(e)}")
-                time.sleep(5)
+                self._log_error(f"Error checking archive status for {archive_id}: {str(e)}")
+            
+            # Still processing (or the check failed): wait and check again,
+            # for as long as the server asked if it said so
+            delay = self._sleep_before_archive_poll(archive_url, delay, start_time + timeout)
         
         elapsed = time.time() - start_time
-        self._log("error", f"❌ Timeout waiting for archive {archive_id} creation (waited {elapsed:.1f}s)")
+        self._log_error(f"❌ Timeout waiting for archive {archive_id} creation (waited {elapsed:.1f}s)")
         return False, "TIMEOUT"
 
+    def list_archived_assets(self, use_cache: bool = True) -> List[Dict]:
+        """
+        Fetch the list of archives from Cesium ION.
+        
+        Results are cached for ARCHIVES_CACHE_TTL seconds, or until an
+        archive is created.
+        
+        Args:
+            use_cache: Whether a recently fetched list may be returned (default: True)
+        
+        Returns:
+            List of archive dictionaries (shared between callers, do not
+            modify), empty if the request fails
+        """
+        with self._archives_cache_lock:
+            fetched_at, cached_archives = self._archives_cache
+            if use_cache and cached_archives is not None and time.monotonic() - fetched_at < ARCHIVES_CACHE_TTL:
+                self._log_debug("Using cached archive list")
+                return cached_archives
+            
+            try:
+                self._log_info("Fetching archive list from Cesium ION")
+                data = self._get_json_cached(self.api_archive_url)
+                archives = data if isinstance(data, list) else data.get('items', [])
+                self._log_info("Successfully fetched %d archives from Cesium ION", len(archives))
+                self._archives_cache = (time.monotonic(), archives)
+                return archives
+            except requests.exceptions.RequestException as e:
+                self._log_error(f"Error fetching archives: {str(e)}")
+                return []
+
+    def wait_for_archives_completion(self, archive_ids: List[str], timeout: int = 300) -> Iterator[Tuple[str, bool, str]]:
+        """
+        Monitor the creation of several archives with one list request per poll.
+        
+        Archives missing from the listing are checked individually.
+        
+        Args:
+            archive_ids: IDs of the archives to monitor
+            timeout: Maximum time to wait in seconds (default: 5 minutes)
+            
+        Yields:
+            Tuple of (archive_id, success, final_status) as each archive finishes
+        """
+        self._log_info(f"Monitoring {len(archive_ids)} archives (timeout: {timeout}s)")
+        start_time = time.time()
+        pending = set(archive_ids)
+        last_statuses: Dict[str, str] = {}
+        delay = ARCHIVE_POLL_INITIAL_DELAY
+        
+        while pending and time.time() - start_time < timeout:
+            archives_by_id = {}
+            # Statuses change between polls, so the list is always fetched
+            # (the ETag still saves the body when nothing changed)
+            for archive in self.list_archived_assets(use_cache=False):
+                archive_id = str(archive.get('id'))
+                if archive_id in pending:
+                    archives_by_id[archive_id] = archive
+            
+            for archive_id in list(pending):
+                archive = archives_by_id.get(archive_id) or self.get_archive_info(archive_id)
+                if not archive:
+                    continue
+                status = archive.get('status', 'UNKNOWN')
+                
+                # Progress means completion may be close, so polling speeds
+                # up again
+                if status != last_statuses.get(archive_id):
+                    self._log_info("Archive %s status changed to: %s (after %.1fs)", archive_id, status, time.time() - start_time)
+                    last_statuses[archive_id] = status
+                    delay = ARCHIVE_POLL_INITIAL_DELAY
+                
+                if status == 'COMPLETE':
+                    pending.discard(archive_id)
+                    yield archive_id, True, status
+                elif status in ['ERROR', 'FAILED']:
+                    pending.discard(archive_id)
+                    yield archive_id, False, status
+            
+            if pending:
+                delay = self._sleep_before_archive_poll(self.api_archive_url, delay, start_time + timeout)
+        
+        for archive_id in pending:
+            self._log_error(f"❌ Timeout waiting for archive {archive_id} creation (waited {time.time() - start_time:.1f}s)")
+            yield archive_id, False, "TIMEOUT"
+
     def create_archives_for_completed_assets(self, asset_ids: List[str]) -> None:
         """
         Create archives for a list of already completed assets.
@@ -757,23 +2001,26 @@ class CesiumAPIHelper:
         Args:
             asset_ids: List of asset IDs to create archives for
         """
-        self._log("info", f"=== Creating archives for {len(asset_ids)} completed assets ===")
+        self._log_info(f"=== Creating archives for {len(asset_ids)} completed assets ===")
         print(f"\n📦 Creating archives for {len(asset_ids)} completed assets...")
         
         completed_assets = []
         failed_assets = []
         
-        # First, check which assets are actually completed
+        # First, check which assets are actually completed. One (cached)
+        # asset list request covers all of them; only assets missing from
+        # it are looked up individually.
         print("🔍 Checking asset statuses...")
+        assets_by_id = self.get_assets_by_ids(asset_ids)
         for asset_id in asset_ids:
-            asset_data = self.get_asset_status(asset_id)
+            asset_data = assets_by_id.get(str(asset_id))
             if asset_data and asset_data.get('status') == 'COMPLETE':
                 completed_assets.append(asset_id)
-                self._log("info", f"Asset {asset_id} is ready for archiving")
+                self._log_info(f"Asset {asset_id} is ready for archiving")
             else:
                 status = asset_data.get('status', 'UNKNOWN') if asset_data else 'ERROR_FETCHING'
                 failed_assets.append((asset_id, status))
-                self._log("warning", f"Asset {asset_id} not ready for archiving (status: {status})")
+                self._log_warning(f"Asset {asset_id} not ready for archiving (status: {status})")
         
         if not completed_assets:
             print("❌ No completed assets found for archiving")
@@ -783,89 +2030,108 @@ class CesiumAPIHelper:
         if failed_assets:
             print(f"⚠️ {len(failed_assets)} assets not ready for archiving")
         
-        # Create archives for completed assets
-        with tqdm(total=len(completed_assets), desc="Creating archives", unit="archive") as pbar:
-            for asset_id in completed_assets:
-                try:
-                    # Create archive
-                    success, archive_id, message = self.create_archive(asset_id)
-                    
+        with tqdm(total=len(completed_assets), desc="Creating archives", unit="archive",
+                  mininterval=PROGRESS_REFRESH_INTERVAL) as pbar:
+            # Archive creation requests are independent per asset, so they
+            # are sent concurrently
+            asset_by_archive: Dict[str, str] = {}
+            with ThreadPoolExecutor(max_workers=ARCHIVE_WORKERS, thread_name_prefix='cesium-archive') as archive_executor:
+                future_to_asset = {
+                    archive_executor.submit(self.create_archive, asset_id): asset_id
+                    for asset_id in completed_assets
+                }
+                for future in as_completed(future_to_asset):
+                    asset_id = future_to_asset[future]
+                    try:
+                        success, archive_id, message = future.result()
+                    except Exception as e:
+                        success, archive_id, message = False, None, f"Unexpected error: {str(e)}"
                     if success and archive_id:
-                        # Wait for archive completion
-                        archive_completed, archive_status = self.wait_for_archive_completion(archive_id)
-                        
-                        if archive_completed:
-                            archive_info = {
-                                'asset_id': asset_id,
-                                'archive_id': archive_id,
-                            }
-                            self.results['archived'].append(archive_info)
-                            self._log("info", f"✅ Archive created successfully for asset {asset_id} (Archive ID: {archive_id})")
-                            pbar.set_postfix_str(f"✅ Asset {asset_id}")
-                        else:
-                            self._log("error", f"❌ Archive creation failed for asset {asset_id} (status: {archive_status})")
-                            pbar.set_postfix_str(f"❌ Asset {asset_id}")
+                        asset_by_archive[archive_id] = asset_id
                     else:
-                        self._log("error", f"❌ Failed to create archive for asset {asset_id}: {message}")
-                        pbar.set_postfix_str(f"❌ Asset {asset_id}")
-                        
-                except Exception as e:
-                    self._log("error", f"❌ Unexpected error creating archive for asset {asset_id}: {str(e)}")
-                    pbar.set_postfix_str(f"❌ Asset {asset_id}")
-                
+                        self._log_error(f"❌ Failed to create archive for asset {asset_id}: {message}")
+                        pbar.set_postfix_str(f"❌ Asset {asset_id}", refresh=False)
+                        pbar.update(1)
+            
+            # Wait for all of them with one archive list request per poll
+            for archive_id, archive_completed, archive_status in self.wait_for_archives_completion(list(asset_by_archive)):
+                asset_id = asset_by_archive[archive_id]
+                if archive_completed:
+                    self.results['archived'].append({
+                        'asset_id': asset_id,
+                        'archive_id': archive_id,
+                    })
+                    self._log_info(f"✅ Archive created successfully for asset {asset_id} (Archive ID: {archive_id})")
+                    pbar.set_postfix_str(f"✅ Asset {asset_id}", refresh=False)
+                else:
+                    self._log_error(f"❌ Archive creation failed for asset {asset_id} (status: {archive_status})")
+                    pbar.set_postfix_str(f"❌ Asset {asset_id}", refresh=False)
                 pbar.update(1)
         
-        # Print results
+        # Print results into one buffer and write it at once
         successful_archives = len(self.results['archived'])
-        print(f"\n📦 Archive creation completed: {successful_archives}/{len(completed_assets)} archives created successfully")
+        buf = io.StringIO()
+        print(f"\n📦 Archive creation completed: {successful_archives}/{len(completed_assets)} archives created successfully", file=buf)
         
-        if self.results['archived']:
-            print("\n📦 CREATED ARCHIVES:")
-            print("-" * 40)
+        if self.results['archived'] and not self.quiet:
+            print("\n📦 CREATED ARCHIVES:", file=buf)
+            print("-" * 40, file=buf)
             for item in self.results['archived']:
                 asset_id = item.get('asset_id', 'Unknown')
                 archive_id = item.get('archive_id', 'Unknown')
                 download_url = item.get('download_url')
-                print(f"  • Asset {asset_id} -> Archive {archive_id}")
+                print(f"  • Asset {asset_id} -> Archive {archive_id}", file=buf)
                 if download_url:
-                    print(f"    Download: {download_url}")
-                print(f"    View Asset: https://ion.cesium.com/assets/{asset_id}")
+                    print(f"    Download: {download_url}", file=buf)
+                print(f"    View Asset: https://ion.cesium.com/assets/{asset_id}", file=buf)
+        
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
-    def download_archive(self, archive_id: str, output_dir: str = "converted") -> Tuple[bool, Optional[str]]:
+    def download_archive(self, archive_id: str, output_dir: str = "converted", show_progress: bool = True, archive_info: Optional[Dict] = None) -> Tuple[bool, Optional[str]]:
         """
         Download an archive from Cesium ION and save it to the specified directory.
         
         Args:
             archive_id: ID of the archive to download
             output_dir: Directory to save the downloaded archive (default: "converted")
+            show_progress: Whether to show a progress bar for this download
+                (default: True); callers running several downloads at once
+                show their own
+            archive_info: Archive details as returned by the API, fetched if
+                not given (e.g. an entry of list_archived_assets())
             
         Returns:
             Tuple of (success, downloaded_file_path)
         """
-        self._log("info", f"Downloading archive {archive_id}...")
+        self._log_info(f"Downloading archive {archive_id}...")
         
         try:
             # Ensure output directory exists
             output_path = Path(output_dir)
             output_path.mkdir(exist_ok=True)
             
-            # Get the archive details first to check status and get metadata
-            archive_info = self.get_archive_info(archive_id)
+            # Get the archive details first to check status and get metadata,
+            # unless the caller already has them
+            if archive_info is None:
+                archive_info = self.get_archive_info(archive_id)
             if not archive_info:
-                self._log("error", f"Could not retrieve archive info for archive {archive_id}")
+                self._log_error(f"Could not retrieve archive info for archive {archive_id}")
                 return False, None
                 
             if archive_info.get('status') != 'COMPLETE':
-                self._log("error", f"Archive {archive_id} is not ready for download (status: {archive_info.get('status')})")
+                self._log_error(f"Archive {archive_id} is not ready for download (status: {archive_info.get('status')})")
                 return False, None
             
             # Request download URL from Cesium ION API
             download_url_endpoint = f"{self.api_archive_url}/{archive_id}/download"
-            self._log("debug", f"Requesting download URL from: {download_url_endpoint}")
+            self._log_debug(f"Requesting download URL from: {download_url_endpoint}")
             
-            response = requests.get(
+            # Streamed so that a direct download is not read into memory
+            # before we know what kind of response this is
+            response = self.session.get(
                 download_url_endpoint,
-                headers=self.headers,
+                stream=True,
                 timeout=30
             )
             response.raise_for_status()
@@ -873,67 +2139,101 @@ class CesiumAPIHelper:
             # Check if response contains a redirect URL or direct download
             if response.headers.get('content-type', '').startswith('application/json'):
                 # Response contains JSON with download URL
-                download_data = response.json()
+                with response:
+                    download_data = parse_json(response)
                 download_url = download_data.get('url') or download_data.get('downloadUrl')
                 if not download_url:
-                    self._log("error", f"No download URL found in response for archive {archive_id}")
+                    self._log_error(f"No download URL found in response for archive {archive_id}")
                     return False, None
+                
+                self._log_debug(f"Download URL obtained for archive {archive_id}")
+                
+                # The URL points at storage outside the Cesium ION API, so
+                # the unauthenticated pooled session is used
+                download_response = self.transfer_session.get(download_url, stream=True, timeout=300)
+                download_response.raise_for_status()
             else:
-                # Direct download response
-                download_url = response.url
-            
-            self._log("debug", f"Download URL obtained for archive {archive_id}")
+                # Direct download response: the body is the archive itself,
+                # so keep streaming it instead of requesting it again
+                download_response = response
             
             # Download the archive file with progress tracking
             archive_name = archive_info.get('name', f'archive_{archive_id}')
             # Clean filename for filesystem
-            safe_name = "".join(c for c in archive_name if c.isalnum() or c in (' ', '-', '_', '.')).rstrip()
+            safe_name = UNSAFE_FILENAME_CHARS.sub('', archive_name).rstrip()
             if not safe_name:
                 safe_name = f'archive_{archive_id}'
             
-            archive_file_path = output_path / f"{safe_name}.zip"
-            
-            # Handle duplicate filenames
-            counter = 1
-            while archive_file_path.exists():
-                name_part = archive_file_path.stem
-                archive_file_path = output_path / f"{name_part}_{counter}.zip"
-                counter += 1
-            
-            self._log("info", f"Downloading archive to: {archive_file_path}")
-            
-            # Download with progress tracking
-            download_response = requests.get(download_url, stream=True)
-            download_response.raise_for_status()
+            # Handle duplicate filenames. A name is claimed by creating its
+            # .part file, so concurrent downloads of archives with the same
+            # name never write to the same file.
+            with self._download_names_lock:
+                # The directory is listed once; names claimed since then
+                # are added, so finding a free name needs no stat calls
+                taken = self._output_dir_names.get(output_dir)
+                if taken is None:
+                    taken = set(os.listdir(output_path))
+                    self._output_dir_names[output_dir] = taken
+                
+                candidate = f"{safe_name}.zip"
+                counter = 1
+                while True:
+                    if candidate not in taken and candidate + '.part' not in taken:
+                        taken.add(candidate)
+                        try:
+                            # Exclusive create guards against other processes
+                            partial_file = open(output_path / (candidate + '.part'), 'xb')
+                            break
+                        except FileExistsError:
+                            pass
+                    candidate = f"{safe_name}_{counter}.zip"
+                    counter += 1
+                archive_file_path = output_path / candidate
+                partial_path = output_path / (candidate + '.part')
             
-            total_size = int(download_response.headers.get('content-length', 0))
+            self._log_info(f"Downloading archive to: {archive_file_path}")
             
-            with open(archive_file_path, 'wb') as f:
-                if total_size > 0:
-                    with tqdm(total=total_size, unit='B', unit_scale=True, desc=f"Downloading {archive_file_path.name}") as pbar:
-                        for chunk in download_response.iter_content(chunk_size=8192):
-                            if chunk:
+            # Stream to the .part file in large chunks so memory use stays
+            # constant, and only move it into place once it is complete
+            try:
+                with download_response, partial_file as f:
+                    total_size = int(download_response.headers.get('content-length', 0))
+                    if download_response.headers.get('content-encoding'):
+                        # Compressed transfer: let requests decode it
+                        chunks = download_response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+                    else:
+                        # The body is the zip itself; read the socket directly
+                        # and skip requests' per-chunk decoding generator
+                        chunks = iter(partial(download_response.raw.read, DOWNLOAD_CHUNK_SIZE), b'')
+                    if total_size > 0 and show_progress:
+                        with tqdm(total=total_size, unit='B', unit_scale=True, desc=f"Downloading {archive_file_path.name}", mininterval=PROGRESS_REFRESH_INTERVAL) as pbar:
+                            for chunk in chunks:
                                 f.write(chunk)
                                 pbar.update(len(chunk))
-                else:
-                    for chunk in download_response.iter_content(chunk_size=8192):
-                        if chunk:
+                    else:
+                        for chunk in chunks:
                             f.write(chunk)
+                os.replace(partial_path, archive_file_path)
+            except BaseException:
+                partial_path.unlink(missing_ok=True)
+                with self._download_names_lock:
+                    taken.discard(archive_file_path.name)
+                raise
             
             # Verify file was downloaded
             if archive_file_path.exists() and archive_file_path.stat().st_size > 0:
                 file_size_mb = archive_file_path.stat().st_size / (1024 * 1024)
-                self._log("info", f"✅ Archive {archive_id} downloaded successfully: {archive_file_path} ({file_size_mb:.2f} MB)")
+                self._log_info(f"✅ Archive {archive_id} downloaded successfully: {archive_file_path} ({file_size_mb:.2f} MB)")
                 return True, str(archive_file_path)
             else:
-                self._log("error", f"❌ Downloaded file is empty or doesn't exist: {archive_file_path}")
+                self._log_error(f"❌ Downloaded file is empty or doesn't exist: {archive_file_path}")
                 return False, None
                 
         except requests.exceptions.RequestException as e:
-            self._log("error", f"❌ Error downloading archive {archive_id}: {str(e)}")
+            self._log_error(f"❌ Error downloading archive {archive_id}: {str(e)}")
             return False, None
         except Exception as e:
-            self._log("error", f"❌ Unexpected error downloading archive {archive_id}: {str(e)}")
+            self._log_error(f"❌ Unexpected error downloading archive {archive_id}: {str(e)}")
             return False, None
 
     def get_archive_info(self, archive_id: str) -> Optional[Dict]:
@@ -944,25 +2244,20 @@ class CesiumAPIHelper:
             archive_id: ID of the archive to get info for
             
         Returns:
-            Archive information dictionary or None if error
+            Archive information dictionary (shared between callers, do not
+            modify) or None if error
         """
         try:
             url = f"{self.api_archive_url}/{archive_id}"
-            self._log("debug", f"Fetching archive info from: {url}")
+            self._log_debug(f"Fetching archive info from: {url}")
             
-            response = requests.get(
-                url,
-                headers=self.headers,
-                timeout=30
-            )
-            response.raise_for_status()
-            archive_data = response.json()
+            archive_data = self._get_json_cached(url)
             
-            self._log("debug", f"Archive {archive_id} info retrieved successfully")
+            self._log_debug(f"Archive {archive_id} info retrieved successfully")
             return archive_data
             
         except requests.exceptions.RequestException as e:
-            self._log("error", f"Error fetching archive info for {archive_id}: {str(e)}")
+            self._log_error(f"Error fetching archive info for {archive_id}: {str(e)}")
             return None
 
     def download_all_completed_archives(self, output_dir: str = "converted") -> List[Dict]:
@@ -975,12 +2270,12 @@ class CesiumAPIHelper:
         Returns:
             List of download results with details
         """
-        self._log("info", "Downloading all completed archives...")
+        self._log_info("Downloading all completed archives...")
         
         # Get list of all archives
         archived_assets = self.list_archived_assets()
         if not archived_assets:
-            self._log("warning", "No archives found")
+            self._log_warning("No archives found")
             print("❌ No archives found")
             return []
         
@@ -991,23 +2286,31 @@ class CesiumAPIHelper:
         ]
         
         if not completed_archives:
-            self._log("warning", "No completed archives found")
+            self._log_warning("No completed archives found")
             print("❌ No completed archives found for download")
             return []
         
         print(f"📦 Found {len(completed_archives)} completed archives for download")
-        self._log("info", f"Found {len(completed_archives)} completed archives for download")
+        self._log_info(f"Found {len(completed_archives)} completed archives for download")
         
         download_results = []
         
-        # Download each archive
-        with tqdm(total=len(completed_archives), desc="Downloading archives", unit="archive") as pbar:
-            for archive in completed_archives:
+        # Download a few archives at once; per-file progress bars would
+        # interleave, so only the overall bar is shown
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix='cesium-download') as download_executor, \
+                tqdm(total=len(completed_archives), desc="Downloading archives", unit="archive",
+                     mininterval=PROGRESS_REFRESH_INTERVAL) as pbar:
+            future_to_archive = {
+                download_executor.submit(self.download_archive, archive.get('id'), output_dir, False, archive): archive
+                for archive in completed_archives
+            }
+            for future in as_completed(future_to_archive):
+                archive = future_to_archive[future]
                 archive_id = archive.get('id')
                 archive_name = archive.get('name', f'Archive {archive_id}')
                 
                 try:
-                    success, file_path = self.download_archive(archive_id, output_dir)
+                    success, file_path = future.result()
                     
                     result = {
                         'archive_id': archive_id,
@@ -1019,10 +2322,10 @@ class CesiumAPIHelper:
                     
                     if success:
                         result['message'] = f"Downloaded successfully to {file_path}"
-                        pbar.set_postfix_str(f"✅ {archive_name}")
+                        pbar.set_postfix_str(f"✅ {archive_name}", refresh=False)
                     else:
                         result['message'] = "Download failed"
-                        pbar.set_postfix_str(f"❌ {archive_name}")
+                        pbar.set_postfix_str(f"❌ {archive_name}", refresh=False)
                     
                     download_results.append(result)
                     
@@ -1035,32 +2338,36 @@ class CesiumAPIHelper:
                         'message': f"Unexpected error: {str(e)}"
                     }
                     download_results.append(result)
-                    self._log("error", f"Unexpected error downloading archive {archive_id}: {str(e)}")
-                    pbar.set_postfix_str(f"❌ {archive_name}")
+                    self._log_error(f"Unexpected error downloading archive {archive_id}: {str(e)}")
+                    pbar.set_postfix_str(f"❌ {archive_name}", refresh=False)
                 
                 pbar.update(1)
         
-        # Print summary
-        successful_downloads = len([r for r in download_results if r['success']])
-        failed_downloads = len([r for r in download_results if not r['success']])
+        # Print summary into one buffer and write it at once
+        successful_downloads = sum(1 for r in download_results if r['success'])
+        failed_downloads = len(download_results) - successful_downloads
+        buf = io.StringIO()
         
-        print(f"\n📥 Download completed: {successful_downloads}/{len(completed_archives)} archives downloaded successfully")
+        print(f"\n📥 Download completed: {successful_downloads}/{len(completed_archives)} archives downloaded successfully", file=buf)
         
-        if successful_downloads > 0:
-            print("\n✅ SUCCESSFULLY DOWNLOADED ARCHIVES:")
-            print("-" * 50)
+        if successful_downloads > 0 and not self.quiet:
+            print("\n✅ SUCCESSFULLY DOWNLOADED ARCHIVES:", file=buf)
+            print("-" * 50, file=buf)
             for result in download_results:
                 if result['success']:
-                    print(f"  • {result['name']} (ID: {result['archive_id']})")
-                    print(f"    File: {result['file_path']}")
+                    print(f"  • {result['name']} (ID: {result['archive_id']})", file=buf)
+                    print(f"    File: {result['file_path']}", file=buf)
                     if result.get('size_mb'):
-                        print(f"    Size: {result['size_mb']:.2f} MB")
+                        print(f"    Size: {result['size_mb']:.2f} MB", file=buf)
         
-        if failed_downloads > 0:
-            print("\n❌ FAILED DOWNLOADS:")
-            print("-" * 30)
+        if failed_downloads > 0 and not self.quiet:
+            print("\n❌ FAILED DOWNLOADS:", file=buf)
+            print("-" * 30, file=buf)
             for result in download_results:
                 if not result['success']:
-                    print(f"  • {result['name']} (ID: {result['archive_id']}): {result['message']}")
+                    print(f"  • {result['name']} (ID: {result['archive_id']}): {result['message']}", file=buf)
+        
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
         
         return download_results
@@ -6,6 +6,7 @@ This script checks the upload and processing status of assets in Cesium ION.
 """
 
 import sys
+import heapq
 import argparse
 from datetime import datetime
 from typing import Optional, List
@@ -87,11 +88,14 @@ def check_multiple_assets(cesium_helper: CesiumAPIHelper, asset_ids: List[str])
     print(f"🔍 Checking {len(asset_ids)} assets...")
     print("=" * 60)
     
+    # One asset list request instead of one request per asset
+    assets_by_id = cesium_helper.get_assets_by_ids(asset_ids)
+    
     for i, asset_id in enumerate(asset_ids, 1):
         print(f"\n[{i}/{len(asset_ids)}] Asset: {asset_id}")
         print("-" * 40)
         
-        asset = cesium_helper.get_asset_status(asset_id)
+        asset = assets_by_id.get(str(asset_id))
         
         if asset is None:
             print(f"❌ Could not retrieve asset {asset_id}")
@@ -119,15 +123,14 @@ def list_recent_assets(cesium_helper: CesiumAPIHelper, limit: int = 10) -> None:
         print("❌ No assets found or error retrieving assets")
         return
     
-    # Sort by date added (most recent first) and limit
-    try:
-        assets_sorted = sorted(
-            assets, 
-            key=lambda x: x.get('dateAdded', ''), 
-            reverse=True
-        )[:limit]
-    except:
-        assets_sorted = assets[:limit]
+    # Most recently added first. Only the top entries are needed, so no
+    # full sort; ISO 8601 dates compare correctly as strings, and assets
+    # without one sort last.
+    assets_sorted = heapq.nlargest(
+        limit,
+        assets,
+        key=lambda x: x.get('dateAdded') or ''
+    )
     
     for i, asset in enumerate(assets_sorted, 1):
         asset_id = asset.get('id', 'Unknown')
@@ -152,9 +155,10 @@ def monitor_assets(cesium_helper: CesiumAPIHelper, asset_ids: List[str], interva
             print("-" * 40)
             
             all_complete = True
+            assets_by_id = cesium_helper.get_assets_by_ids(asset_ids)
             
             for asset_id in asset_ids:
-                asset = cesium_helper.get_asset_status(asset_id)
+                asset = assets_by_id.get(str(asset_id))
                 
                 if asset is None:
                     print(f"❌ {asset_id}: Could not retrieve")
@@ -5,10 +5,25 @@ Cesium ION Archive Downloader
 This script downloads archives from Cesium ION and saves them to the 'converted' folder.
 """
 
+import io
 import sys
 import argparse
 from pathlib import Path
-from cesium_helper import CesiumAPIHelper
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from cesium_helper import CesiumAPIHelper, DOWNLOAD_WORKERS
+
+# Emoji for archive statuses in the --list-only output; others show ❌
+ARCHIVE_STATUS_EMOJIS = {'COMPLETE': '✅', 'PROCESSING': '⏳'}
+
+# One archive entry of the --list-only output
+ARCHIVE_LISTING_TEMPLATE = (
+    "  {emoji} Archive ID: {id}\n"
+    "    Name: {name}\n"
+    "    Status: {status}\n"
+    "    Size: {size:.2f} MB\n"
+    "    Asset IDs: {asset_ids}\n"
+    "\n"
+)
 
 
 def main():
@@ -21,6 +36,7 @@ Examples:
   python download_archives.py                    # Download all completed archives
   python download_archives.py --archive-ids 123 456  # Download specific archives
   python download_archives.py --output-dir downloads  # Download to custom directory
+  python download_archives.py --workers 2        # Download at most 2 archives at once
   python download_archives.py --logging          # Enable detailed logging
         """
     )
@@ -37,6 +53,13 @@ Examples:
         help='Output directory for downloaded archives (default: converted)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DOWNLOAD_WORKERS,
+        help=f'Number of archives downloaded at once with --archive-ids (default: {DOWNLOAD_WORKERS})'
+    )
+    
     parser.add_argument(
         '--logging',
         action='store_true',
@@ -75,25 +98,24 @@ Examples:
                 print("❌ No archives found")
                 return
             
-            print(f"📦 Found {len(archived_assets)} archives:")
-            print("-" * 60)
+            # Build the listing in one buffer and write it at once
+            buf = io.StringIO()
+            print(f"📦 Found {len(archived_assets)} archives:", file=buf)
+            print("-" * 60, file=buf)
             
             for archive in archived_assets:
-                archive_id = archive.get('id', 'Unknown')
-                name = archive.get('name', 'Unnamed')
                 status = archive.get('status', 'Unknown')
-                size = archive.get('size', 0)
-                asset_ids = archive.get('assetIds', [])
-                
-                status_emoji = "✅" if status == "COMPLETE" else "⏳" if status == "PROCESSING" else "❌"
-                
-                print(f"  {status_emoji} Archive ID: {archive_id}")
-                print(f"    Name: {name}")
-                print(f"    Status: {status}")
-                print(f"    Size: {size:.2f} MB")
-                print(f"    Asset IDs: {', '.join(map(str, asset_ids))}")
-                print()
+                buf.write(ARCHIVE_LISTING_TEMPLATE.format(
+                    emoji=ARCHIVE_STATUS_EMOJIS.get(status, '❌'),
+                    id=archive.get('id', 'Unknown'),
+                    name=archive.get('name', 'Unnamed'),
+                    status=status,
+                    size=archive.get('size', 0),
+                    asset_ids=', '.join(map(str, archive.get('assetIds', [])))
+                ))
             
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
             return
         
         if args.archive_ids:
@@ -101,39 +123,60 @@ Examples:
             print(f"📥 Downloading {len(args.archive_ids)} specific archives...")
             
             download_results = []
-            for archive_id in args.archive_ids:
-                print(f"\n🔽 Downloading archive {archive_id}...")
-                success, file_path = cesium_helper.download_archive(archive_id, args.output_dir)
-                
-                result = {
-                    'archive_id': archive_id,
-                    'success': success,
-                    'file_path': file_path
-                }
-                download_results.append(result)
+            # Several archives download at once; their byte progress bars
+            # would interleave, so they are only shown for a single archive
+            show_progress = len(args.archive_ids) == 1
+            
+            # One archive list request gives the status and name of all of
+            # them; archives missing from it are looked up by download_archive
+            archives_by_id = {}
+            if len(args.archive_ids) > 1:
+                archives_by_id = {str(archive.get('id')): archive for archive in cesium_helper.list_archived_assets()}
+            
+            with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+                future_to_id = {}
+                for archive_id in args.archive_ids:
+                    print(f"🔽 Downloading archive {archive_id}...")
+                    future = executor.submit(cesium_helper.download_archive, archive_id, args.output_dir, show_progress, archives_by_id.get(str(archive_id)))
+                    future_to_id[future] = archive_id
                 
-                if success:
-                    print(f"✅ Archive {archive_id} downloaded successfully to: {file_path}")
-                else:
-                    print(f"❌ Failed to download archive {archive_id}")
+                for future in as_completed(future_to_id):
+                    archive_id = future_to_id[future]
+                    success, file_path = future.result()
+                    
+                    result = {
+                        'archive_id': archive_id,
+                        'success': success,
+                        'file_path': file_path
+                    }
+                    download_results.append(result)
+                    
+                    if success:
+                        print(f"✅ Archive {archive_id} downloaded successfully to: {file_path}")
+                    else:
+                        print(f"❌ Failed to download archive {archive_id}")
             
             # Print summary
-            successful = len([r for r in download_results if r['success']])
-            failed = len([r for r in download_results if not r['success']])
+            successful = sum(1 for r in download_results if r['success'])
+            failed = len(download_results) - successful
             
-            print(f"\n📊 Download Summary: {successful}/{len(args.archive_ids)} archives downloaded successfully")
+            buf = io.StringIO()
+            print(f"\n📊 Download Summary: {successful}/{len(args.archive_ids)} archives downloaded successfully", file=buf)
             
             if successful > 0:
-                print("\n✅ SUCCESSFUL DOWNLOADS:")
+                print("\n✅ SUCCESSFUL DOWNLOADS:", file=buf)
                 for result in download_results:
                     if result['success']:
-                        print(f"  • Archive {result['archive_id']}: {result['file_path']}")
+                        print(f"  • Archive {result['archive_id']}: {result['file_path']}", file=buf)
             
             if failed > 0:
-                print("\n❌ FAILED DOWNLOADS:")
+                print("\n❌ FAILED DOWNLOADS:", file=buf)
                 for result in download_results:
                     if not result['success']:
-                        print(f"  • Archive {result['archive_id']}")
+                        print(f"  • Archive {result['archive_id']}", file=buf)
+            
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
         
         else:
             # Download all completed archives
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+HTTP Helpers
+
+Small, dependency-free helpers shared by the Cesium ION and 3D tiles
+upload modules.
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+def retry_after_seconds(response) -> Optional[float]:
+    """Read the Retry-After header of a response.
+    
+    Args:
+        response: Response to inspect (anything with a headers mapping,
+            e.g. requests.Response)
+        
+    Returns:
+        Seconds to wait before the next request, or None if the header is
+        missing or malformed
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -11,8 +11,7 @@ import argparse
 import logging
 from pathlib import Path
 from datetime import datetime
-from cesium_helper import CesiumAPIHelper
-from upload2S3_helper import upload_subgrids_bulk
+from cesium_helper import CesiumAPIHelper, DEFAULT_MAX_WORKERS
 
 def setup_main_logging(enabled: bool = False) -> logging.Logger:
     """Set up logging for the main script.
@@ -34,8 +33,8 @@ def setup_main_logging(enabled: bool = False) -> logging.Logger:
     return logger
 
 
-def main():
-    """Main function to orchestrate the upload process."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for the uploader."""
     parser = argparse.ArgumentParser(
         description="Upload GML files to Cesium ION with complete workflow",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -52,6 +51,7 @@ Examples:
   python main.py --wait --archive --download --logging  # Complete workflow with downloads and logging
   python main.py --upload2S3            # Upload subgrids to 3D tiles API
   python main.py --wait --archive --download --upload2S3  # Complete workflow with S3 upload
+  python main.py --force                # Re-upload files that were already uploaded
         """
     )
     
@@ -64,8 +64,8 @@ Examples:
     parser.add_argument(
         '--workers', 
         type=int, 
-        default=5, 
-        help='Number of concurrent uploads (default: 5)'
+        default=DEFAULT_MAX_WORKERS, 
+        help=f'Number of concurrent uploads (default: {DEFAULT_MAX_WORKERS}, set CESIUM_MAX_WORKERS to change)'
     )
     
     parser.add_argument(
@@ -86,25 +86,27 @@ Examples:
         help='Download archives after creation to converted folder (requires --archive)'
     )
 
+    parser.add_argument(
+        '--force', 
+        action='store_true', 
+        help='Re-upload files already recorded in cesium_uploads.jsonl or already present on Cesium ION'
+    )
+
     parser.add_argument(
     '--upload2S3', 
     action='store_true', 
     help='Upload subgrids from converted folder to 3D tiles API using centroid.csv'
     )
-
-    args = parser.parse_args()
     
-    # Validate arguments
-    if args.archive and not args.wait:
-        print("❌ Error: --archive requires --wait (archives can only be created after processing completes)")
-        parser.print_help()
-        return
-    
-    if args.download and not args.archive:
-        print("❌ Error: --download requires --archive (downloads can only happen after archive creation)")
-        parser.print_help()
-        return
+    return parser
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run the upload workflow for parsed command line arguments.
     
+    Args:
+        args: Arguments from build_parser(), already validated
+    """
     # Set up logging for main script
     logger = setup_main_logging(args.logging)
     
@@ -118,7 +120,7 @@ Examples:
         print("=" * 50)
         
         log_if_enabled("info", "=== GML to Cesium ION Uploader Started ===")
-        log_if_enabled("info", f"Command line arguments: wait={args.wait}, workers={args.workers}, logging={args.logging}, archive={args.archive}, download={args.download}")
+        log_if_enabled("info", f"Command line arguments: wait={args.wait}, workers={args.workers}, logging={args.logging}, archive={args.archive}, download={args.download}, force={args.force}")
         
         cesium_completed = False
         
@@ -128,7 +130,7 @@ Examples:
             log_if_enabled("info", "Starting Cesium ION upload process")
 
             # Initialize uploader (this will set up the main logging)
-            cesiumHelper = CesiumAPIHelper(enable_logging=args.logging)
+            cesiumHelper = CesiumAPIHelper(enable_logging=args.logging, max_workers=args.workers)
             
             # Get GML files
             gml_files = cesiumHelper.get_gml_files()
@@ -155,7 +157,8 @@ Examples:
                 max_workers=args.workers, 
                 wait_for_completion=args.wait,
                 create_archive=args.archive,
-                download_archive=args.download
+                download_archive=args.download,
+                force=args.force
             )
             end_time = datetime.now()
             
@@ -167,8 +170,15 @@ Examples:
             cesiumHelper.print_summary()
             cesium_completed = True
             
+            # Tally the results once for the reporting below
+            success_count = sum(1 for r in cesiumHelper.results['uploads'] if r.ok)
+            archived = cesiumHelper.results['archived']
+            archived_count = len(archived)
+            downloaded_count = sum(1 for item in archived if item.get('download_path'))
+            total_count = len(gml_files) - len(cesiumHelper.results['skipped'])
+            
             # If uploads were successful and we didn't wait, show monitoring tip
-            if not args.wait and cesiumHelper.results['success']:
+            if not args.wait and success_count > 0:
                 asset_ids = cesiumHelper.get_asset_ids_from_results()
                 if asset_ids:
                     print("\n💡 Monitor processing status with:")
@@ -179,11 +189,6 @@ Examples:
                     log_if_enabled("info", f"Generated monitoring command for {len(asset_ids)} assets")
             
             # Final success/failure determination
-            success_count = len(cesiumHelper.results['success'])
-            archived_count = len(cesiumHelper.results['archived'])
-            downloaded_count = len([item for item in cesiumHelper.results['archived'] if item.get('download_path')])
-            total_count = len(gml_files)
-        
             if success_count == total_count:
                 log_if_enabled("info", "✅ All uploads completed successfully")
                 if args.download and downloaded_count > 0:
@@ -215,6 +220,9 @@ Examples:
             log_if_enabled("info", "Starting 3D tiles upload process")
             
             try:
+                # Only needed for --upload2S3, so not imported at startup
+                from upload2S3_helper import upload_subgrids_bulk
+                
                 successful, failed = upload_subgrids_bulk(enable_logging=args.logging)
                 
                 if successful:
@@ -246,5 +254,24 @@ Examples:
         log_if_enabled("info", "=== GML to AWS Uploader Finished ===")
 
 
+def main():
+    """Main function to orchestrate the upload process."""
+    parser = build_parser()
+    args = parser.parse_args()
+    
+    # Validate arguments
+    if args.archive and not args.wait:
+        print("❌ Error: --archive requires --wait (archives can only be created after processing completes)")
+        parser.print_help()
+        return
+    
+    if args.download and not args.archive:
+        print("❌ Error: --download requires --archive (downloads can only happen after archive creation)")
+        parser.print_help()
+        return
+    
+    run(args)
+
+
 if __name__ == "__main__":
     main()
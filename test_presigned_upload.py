@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for presigned single-part S3 uploads
+"""
+
+import os
+import tempfile
+import unittest
+
+import requests
+from requests.adapters import BaseAdapter
+
+os.environ.setdefault('CESIUM_ION_TOKEN', 'test-token')
+
+from cesium_helper import CesiumAPIHelper
+
+
+class RecordingAdapter(BaseAdapter):
+    """Adapter that records prepared requests instead of sending them."""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = 200
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+class PresignedUploadTest(unittest.TestCase):
+    def setUp(self):
+        self.helper = CesiumAPIHelper()
+        self.adapter = RecordingAdapter()
+        self.helper.transfer_session.mount('https://', self.adapter)
+
+    def upload(self, content: bytes) -> requests.PreparedRequest:
+        with tempfile.NamedTemporaryFile(suffix='.gml', delete=False) as f:
+            f.write(content)
+        self.addCleanup(os.unlink, f.name)
+        self.helper._upload_file_presigned(f.name, 'test.gml', {'url': 'https://bucket.s3.amazonaws.com/key?X-Amz-Signature=abc'})
+        self.assertEqual(len(self.adapter.requests), 1)
+        return self.adapter.requests[0]
+
+    def test_empty_file_is_sent_with_content_length(self):
+        request = self.upload(b'')
+        self.assertEqual(request.method, 'PUT')
+        self.assertEqual(request.headers.get('Content-Length'), '0')
+        self.assertNotIn('Transfer-Encoding', request.headers)
+
+    def test_file_is_sent_with_content_length(self):
+        request = self.upload(b'<gml/>')
+        self.assertEqual(request.headers.get('Content-Length'), '6')
+        self.assertNotIn('Transfer-Encoding', request.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -57,7 +57,7 @@ def test_files():
     # Test data folder
     data_folder = Path('data')
     if data_folder.exists() and data_folder.is_dir():
-        gml_files = list(data_folder.glob('*.gml'))
+        gml_files = [f for f in data_folder.iterdir() if f.suffix.lower() == '.gml' and f.is_file()]
         print(f"  ✅ data/ - EXISTS ({len(gml_files)} GML files)")
         for gml_file in gml_files:
             print(f"    • {gml_file.name}")
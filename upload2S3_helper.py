@@ -1,20 +1,84 @@
+import io
+import sys
 import zipfile
-import pandas as pd
+import csv
 import requests
 import os
 import tempfile
 import shutil
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from http_utils import retry_after_seconds
 import logging
 
+try:
+    # Optional streaming multipart encoder
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
 # Load environment variables
 load_dotenv()
 
-def upload_subgrids_bulk(enable_logging=False):
+# Smallest possible ZIP file (an empty archive's end-of-central-directory
+# record); anything shorter is truncated and would be rejected by the API
+MIN_ZIP_SIZE = 22
+
+# ZIP files uploaded at once. Kept low so the API is not flooded.
+UPLOAD_WORKERS = 4
+
+# Responses meaning the API is overloaded. The upload was not accepted, so
+# it is sent again after a pause that all workers observe.
+RATE_LIMIT_STATUS_CODES = (429, 503)
+
+# Attempts per file while the API keeps answering with one of those
+RATE_LIMIT_MAX_ATTEMPTS = 4
+
+# Pause after the first rate-limited response (seconds), doubled per
+# attempt unless the API sends Retry-After
+RATE_LIMIT_INITIAL_DELAY = 2.0
+
+# Connections kept open to the 3D tiles API
+HTTP_POOL_MAXSIZE = 16
+
+# Retries for failed connections and gateway errors. POST is not in the
+# default allowed methods, so an upload that reached the server is never
+# sent twice; only connection failures are retried for it.
+HTTP_RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+
+
+def create_session(api_key: str) -> requests.Session:
+    """
+    Create a session for the 3D tiles API that reuses its connections.
+    
+    Args:
+        api_key: API key sent with every request
+        
+    Returns:
+        Session with the Authorization header set
+    """
+    session = requests.Session()
+    session.headers.update({"Authorization": f"ApiKey {api_key}"})
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=HTTP_RETRY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def upload_subgrids_bulk(enable_logging=False, max_workers: int = UPLOAD_WORKERS):
     """
     Bulk upload subgrids to the 3D tiles API from converted folder
+    
+    Args:
+        enable_logging: Whether to enable logging (default: False)
+        max_workers: Number of ZIP files uploaded at once (default: 4)
     """
     
     # Set up logging
@@ -36,10 +100,6 @@ def upload_subgrids_bulk(enable_logging=False):
     if not API_KEY:
         raise ValueError("UGM_API_KEY not found in environment variables")
     
-    headers = {
-        "Authorization": f"ApiKey {API_KEY}"
-    }
-    
     print("=== Bulk 3D Tiles Subgrid Uploader ===\n")
     log_if_enabled("info", "Starting bulk upload process")
     
@@ -59,8 +119,15 @@ def upload_subgrids_bulk(enable_logging=False):
         log_if_enabled("error", "centroid.csv file not found")
         return [], []
     
-    # Find zip files in converted folder
-    zip_files = list(converted_folder.glob("*.zip"))
+    # Find zip files in converted folder. One directory listing; the file
+    # type comes with the entries, and only the ZIP files are stat'ed (for
+    # their size). The extension is matched case-insensitively.
+    with os.scandir(converted_folder) as entries:
+        zip_sizes = {
+            Path(entry.path): entry.stat().st_size for entry in entries
+            if entry.name.lower().endswith('.zip') and entry.is_file()
+        }
+    zip_files = list(zip_sizes)
     
     if not zip_files:
         print("❌ No ZIP files found in 'converted' folder.")
@@ -72,52 +139,75 @@ def upload_subgrids_bulk(enable_logging=False):
     
     # Read CSV file
     try:
-        df = pd.read_csv(csv_file)
-        print(f"📊 CSV loaded successfully. Found {len(df)} records.")
-        print("CSV columns:", df.columns.tolist())
-        log_if_enabled("info", f"CSV loaded with {len(df)} records")
+        # Index the rows by lowercased name once instead of scanning the
+        # table for every ZIP file. The first row wins, as before.
+        centroids = {}
+        record_count = 0
+        with open(csv_file, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            columns = next(reader, [])
+            for row in reader:
+                if len(row) < 3:
+                    continue
+                record_count += 1
+                centroids.setdefault(row[0].lower(), (row[0], row[1], row[2]))
+        print(f"📊 CSV loaded successfully. Found {record_count} records.")
+        print("CSV columns:", columns)
+        log_if_enabled("info", f"CSV loaded with {record_count} records")
     except Exception as e:
         print(f"❌ Error reading CSV: {e}")
         log_if_enabled("error", f"Error reading CSV: {e}")
         return [], []
     
-    # Process each zip file
-    successful_uploads = []
-    failed_uploads = []
+    # One session for all uploads, so each file after the first reuses an
+    # open TLS connection instead of handshaking again
+    session = create_session(API_KEY)
+    
+    # While the API is rate limiting, every worker holds off until this
+    # time.monotonic() value, so the load drops for all of them at once
+    pause_lock = threading.Lock()
+    pause_until = 0.0
     
-    for zip_file in zip_files:
+    def upload_one(zip_file: Path) -> Tuple[bool, Dict]:
+        """Upload one ZIP file; returns (success, result entry)."""
+        nonlocal pause_until
         try:
+            # A truncated file would only come back as an API error after
+            # being sent in full
+            if zip_sizes[zip_file] < MIN_ZIP_SIZE:
+                print(f"⚠️  {zip_file.name} is empty or truncated, skipping...")
+                log_if_enabled("warning", f"{zip_file.name} is too small to be a ZIP file ({zip_sizes[zip_file]} bytes)")
+                return False, {"file": zip_file.name, "error": "Empty or truncated ZIP file"}
+            
             # Extract filename without extension for matching with CSV
             base_name = zip_file.stem
             
-            # Find matching row in CSV
-            matching_rows = df[df.iloc[:, 0].str.contains(base_name, case=False, na=False)]
+            # Find matching row in CSV: the row named like the file, else
+            # the first row whose name contains it
+            key = base_name.lower()
+            row = centroids.get(key)
+            if row is None:
+                row = next((value for name_key, value in centroids.items() if key in name_key), None)
             
-            if matching_rows.empty:
+            if row is None:
                 print(f"⚠️  No matching CSV entry found for {zip_file.name}, skipping...")
-                failed_uploads.append({"file": zip_file.name, "error": "No matching CSV entry"})
                 log_if_enabled("warning", f"No CSV match for {zip_file.name}")
-                continue
+                return False, {"file": zip_file.name, "error": "No matching CSV entry"}
             
-            # Get coordinates from CSV (assuming columns are: name, center_x, center_y)
-            row = matching_rows.iloc[0]
-            name = str(row.iloc[0])  # First column as name
-            center_x = str(row.iloc[1])  # Second column as center_x
-            center_y = str(row.iloc[2])  # Third column as center_y
+            # Coordinates from CSV (assuming columns are: name, center_x, center_y)
+            name, center_x, center_y = row
             
-            print(f"\n📤 Uploading {zip_file.name}...")
-            print(f"   Name: {name}")
-            print(f"   Center X: {center_x}")
-            print(f"   Center Y: {center_y}")
+            # One print per file so lines of parallel uploads do not interleave
+            print(f"\n📤 Uploading {zip_file.name}...\n"
+                  f"   Name: {name}\n"
+                  f"   Center X: {center_x}\n"
+                  f"   Center Y: {center_y}")
             
             log_if_enabled("info", f"Uploading {zip_file.name} - {name}")
             
-            # Get current timestamp
-            now = datetime.now().isoformat()
-            
             # Prepare multipart form data
             with open(zip_file, 'rb') as f:
-                files_data = {'file': (zip_file.name, f, 'application/zip')}
+                file_field = (zip_file.name, f, 'application/zip')
                 
                 form_data = {
                     'name': name,
@@ -130,58 +220,103 @@ def upload_subgrids_bulk(enable_logging=False):
                     'updatedAt': now
                 }
                 
-                # Make POST request
-                response = requests.post(
-                    API_URL,
-                    headers=headers,
-                    files=files_data,
-                    data=form_data,
-                    timeout=300  # 5 minutes timeout
-                )
+                for attempt in range(1, RATE_LIMIT_MAX_ATTEMPTS + 1):
+                    # Wait out a pause started by any worker
+                    wait = pause_until - time.monotonic()
+                    if wait > 0:
+                        time.sleep(wait)
+                    f.seek(0)
+                    
+                    # Make POST request
+                    if MultipartEncoder is None:
+                        # requests builds the whole body, ZIP included, in memory
+                        response = session.post(
+                            API_URL,
+                            files={'file': file_field},
+                            data=form_data,
+                            timeout=300  # 5 minutes timeout
+                        )
+                    else:
+                        # Streams the ZIP from disk while sending, so memory use
+                        # does not grow with the file size
+                        encoder = MultipartEncoder(fields={**form_data, 'file': file_field})
+                        response = session.post(
+                            API_URL,
+                            data=encoder,
+                            headers={'Content-Type': encoder.content_type},
+                            timeout=300  # 5 minutes timeout
+                        )
+                    
+                    if response.status_code not in RATE_LIMIT_STATUS_CODES or attempt == RATE_LIMIT_MAX_ATTEMPTS:
+                        break
+                    
+                    delay = retry_after_seconds(response)
+                    if delay is None:
+                        delay = RATE_LIMIT_INITIAL_DELAY * 2 ** (attempt - 1)
+                    with pause_lock:
+                        pause_until = max(pause_until, time.monotonic() + delay)
+                    print(f"   ⏳ API busy (HTTP {response.status_code}), retrying {zip_file.name} in {delay:.0f}s...")
+                    log_if_enabled("warning", f"Rate limited uploading {zip_file.name} (HTTP {response.status_code}), pausing uploads for {delay:.1f}s")
             
             if response.status_code in [200, 201]:
                 print(f"   ✅ Successfully uploaded {zip_file.name}")
-                successful_uploads.append({
+                log_if_enabled("info", f"Successfully uploaded {zip_file.name}")
+                return True, {
                     "file": zip_file.name,
                     "name": name,
                     "response": response.json() if response.content else "Success"
-                })
-                log_if_enabled("info", f"Successfully uploaded {zip_file.name}")
+                }
             else:
                 error_msg = f"HTTP {response.status_code}: {response.text}"
                 print(f"   ❌ Failed to upload {zip_file.name}: {error_msg}")
-                failed_uploads.append({
+                log_if_enabled("error", f"Failed to upload {zip_file.name}: {error_msg}")
+                return False, {
                     "file": zip_file.name,
                     "error": error_msg
-                })
-                log_if_enabled("error", f"Failed to upload {zip_file.name}: {error_msg}")
+                }
         
         except Exception as e:
             error_msg = str(e)
             print(f"   ❌ Error processing {zip_file.name}: {error_msg}")
-            failed_uploads.append({
+            log_if_enabled("error", f"Error processing {zip_file.name}: {error_msg}")
+            return False, {
                 "file": zip_file.name,
                 "error": error_msg
-            })
-            log_if_enabled("error", f"Error processing {zip_file.name}: {error_msg}")
+            }
     
-    # Summary report
-    print("\n" + "="*50)
-    print("📊 UPLOAD SUMMARY")
-    print("="*50)
-    print(f"✅ Successful uploads: {len(successful_uploads)}")
-    print(f"❌ Failed uploads: {len(failed_uploads)}")
+    # One timestamp for the whole batch, used as createdAt and updatedAt
+    now = datetime.now().isoformat()
+    
+    # Process the zip files, a few at a time; results keep the file order
+    successful_uploads = []
+    failed_uploads = []
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(zip_files)))) as executor:
+        for ok, result in executor.map(upload_one, zip_files):
+            (successful_uploads if ok else failed_uploads).append(result)
+    
+    # Summary report, built in one buffer and written at once
+    buf = io.StringIO()
+    print("\n" + "="*50, file=buf)
+    print("📊 UPLOAD SUMMARY", file=buf)
+    print("="*50, file=buf)
+    print(f"✅ Successful uploads: {len(successful_uploads)}", file=buf)
+    print(f"❌ Failed uploads: {len(failed_uploads)}", file=buf)
     
     if successful_uploads:
-        print("\n✅ Successfully uploaded files:")
+        print("\n✅ Successfully uploaded files:", file=buf)
         for upload in successful_uploads:
-            print(f"   - {upload['file']} ({upload['name']})")
+            print(f"   - {upload['file']} ({upload['name']})", file=buf)
     
     if failed_uploads:
-        print("\n❌ Failed uploads:")
+        print("\n❌ Failed uploads:", file=buf)
         for failure in failed_uploads:
-            print(f"   - {failure['file']}: {failure['error']}")
+            print(f"   - {failure['file']}: {failure['error']}", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
     
+    session.close()
     log_if_enabled("info", f"Upload process completed: {len(successful_uploads)} successful, {len(failed_uploads)} failed")
     
     print(f"\n🎉 Bulk upload process completed!")